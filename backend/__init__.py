@@ -1,6 +1,13 @@
 """Backend package for ThermoLogger."""
 
 from .thermo_worker import ThermoThread, DummySMtc
-from .epaper_display import EpaperDisplay
 
 __all__ = ["ThermoThread", "DummySMtc", "EpaperDisplay"]
+
+
+def __getattr__(name):
+    """Import EpaperDisplay on first use so PIL and the EPD driver load only when needed."""
+    if name == "EpaperDisplay":
+        from .epaper_display import EpaperDisplay
+        return EpaperDisplay
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
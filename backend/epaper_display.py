@@ -4,30 +4,116 @@ from __future__ import annotations
 
 import os
 import sys
+import functools
 import logging
 import math
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import PIL
 from PIL import Image, ImageDraw, ImageFont
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
-import io
+
+from backend.error_logger import ErrorLogger
+
+# Child of the configured "ThermoLogger" logger, so records reach its file and console handlers.
+# Going through get_logger() sets those handlers up before the import-time messages below.
+logger = ErrorLogger.get_logger().getChild("epaper")
 
 try:
-    from waveshare_epd import epd7in5_V2
+    from waveshare_epd import epd7in5_V2, epdconfig
     HAS_EPAPER = True
-    print("[EPAPER] Successfully imported waveshare_epd library")
+    logger.debug("Imported waveshare_epd library")
 except ImportError as e:
     HAS_EPAPER = False
-    print(f"[EPAPER] Failed to import waveshare_epd: {e}")
+    logger.info("Failed to import waveshare_epd: %s", e)
 except Exception as e:
     HAS_EPAPER = False
-    print(f"[EPAPER] Error importing waveshare_epd: {e}")
+    logger.warning("Error importing waveshare_epd: %s", e)
+
+# Plain left-to-right layout: the display needs no shaping, so skip Raqm/HarfBuzz
+try:
+    LAYOUT_BASIC = ImageFont.Layout.BASIC
+except AttributeError:  # Pillow < 9.1
+    LAYOUT_BASIC = ImageFont.LAYOUT_BASIC
+try:
+    ROTATE_90 = Image.Transpose.ROTATE_90
+except AttributeError:  # Pillow < 9.1
+    ROTATE_90 = Image.ROTATE_90
+
+
+# Loaded faces keyed by (path, size); truetype() reparses the file on every call
+_FONT_CACHE: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+
+
+def _load_font(path, size: int) -> ImageFont.FreeTypeFont:
+    """Load (or reuse) a TrueType font with the basic layout engine."""
+    key = (str(path), size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ImageFont.truetype(path, size, layout_engine=LAYOUT_BASIC)
+    return font
+
+
+# Places the Digital-7 Mono font is looked for, in order
+_PROJECT_ROOT = Path(__file__).parent.parent
+DIGITAL_FONT_CANDIDATES = [
+    _PROJECT_ROOT / "fonts" / "Digital-7-Mono.ttf",
+    _PROJECT_ROOT / "fonts" / "Digital-7 Mono.ttf",
+    _PROJECT_ROOT / "fonts" / "digital-7-mono.ttf",
+    Path.home() / ".local/share/fonts/digital-7-Mono.ttf",  # User fonts (~/.)
+    "/home/pi/ThermoLogger/fonts/Digital-7-Mono.ttf",  # Local project fonts on Pi
+    "/home/pi/.local/share/fonts/Digital-7-Mono.ttf",  # Raspberry Pi user fonts
+    "/usr/local/share/fonts/Digital-7-Mono.ttf",  # System-wide fonts
+    "/usr/share/fonts/truetype/Digital-7-Mono.ttf",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _find_digital_font() -> Optional[str]:
+    """Find the Digital-7 font once per process, in candidate order."""
+    for path in DIGITAL_FONT_CANDIDATES:
+        if Path(path).exists():
+            return str(path)
+    return None
+
+
+# Characters that can appear in a formatted temperature value
+DIGIT_GLYPHS = "0123456789.-"
+NO_READING_TEXT = "--"
+UNIT_TEXT = "°C"
+# Minimum seconds between logged display_readings errors
+ERROR_LOG_INTERVAL = 60.0
+# Time buckets across the plot range; the plot area is roughly this many pixels wide
+PLOT_BUCKETS = 400
+# Default seconds between plot re-renders (one pixel is ~9 s of a 1 h range);
+# overridden by settings_manager.plot_interval
+PLOT_INTERVAL = 10.0
+# Samples kept in the history mirror (2 h at 1 Hz, like the GUI's history deque)
+HISTORY_CAPACITY = 7200
+# Composed value strings kept before the cache is reset (a few hundred distinct readings)
+VALUE_RUN_CACHE_SIZE = 512
+# Line style markers drawn under each channel label, matching the plot styles
+LINESTYLE_SYMBOLS = {0: '━', 1: '···', 2: '- -', 3: '-·-', 4: '--··'}
+# Plot line dash patterns in pixel columns (on, off, ...) for the same styles; None = solid
+PLOT_DASHES = [None, (2, 3), (8, 3), (13, 3, 2, 3), (6, 2, 2, 2, 2, 2)]
+# Axes box inside the plot image as fractions of its size (left, top, right, bottom)
+PLOT_AXES = (0.12, 0.05, 0.95, 0.85)
+
+
+def _format_reading(reading) -> Tuple[str, str]:
+    """Return (value_text, unit_text) for a reading; missing or NaN shows as "--"."""
+    try:
+        temp_val = float(reading)
+    except (TypeError, ValueError):
+        return NO_READING_TEXT, UNIT_TEXT
+    if math.isnan(temp_val):
+        return NO_READING_TEXT, UNIT_TEXT
+    return f"{temp_val:.1f}", UNIT_TEXT
 
 
 class EpaperDisplay:
@@ -39,6 +125,24 @@ class EpaperDisplay:
         self.epd = None
         self.settings_manager = settings_manager
         self.history = []
+        # History mirror: preallocated buffers of twice HISTORY_CAPACITY rows, filled left
+        # to right and compacted when full; _hist_t/_hist_v are views of the live rows
+        self._hist_tbuf: np.ndarray = np.empty(0)
+        self._hist_vbuf: np.ndarray = np.empty((0, 0))
+        self._hist_start = 0
+        self._hist_end = 0
+        self._hist_t: np.ndarray = np.empty(0)  # Sample times as epoch seconds
+        self._hist_v: np.ndarray = np.empty((0, 0))  # Readings, one column per channel
+        self._hist_last_ts: Optional[datetime] = None  # Newest sample already mirrored
+        # Per-bucket sums/counts of the history for the plot, aligned to absolute time
+        self._bkt_width: Optional[float] = None  # Bucket width in seconds; None = rebuild
+        self._bkt_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self._bkt_sum: np.ndarray = np.empty((0, 0))
+        self._bkt_cnt: np.ndarray = np.empty((0, 0))
+        self._bkt_t_end: float = 0.0  # Time of the newest sample folded into the buckets
+        # (layout key, render time, image) of the last plot, reused for PLOT_INTERVAL seconds
+        self._last_plot: Optional[tuple] = None
+        self._stipples: Dict[tuple, np.ndarray] = {}  # Dash column masks by (style, width)
         self.unplugged_channels: List[int] = []  # Channels with 0.00 mV (unplugged)
         self.unplugged_icon = None  # Cached unplugged icon image
         # Standard fonts for headers and labels
@@ -57,7 +161,7 @@ class EpaperDisplay:
         self.font_digital_medium = None
         self.available = False
         self.last_readings: List[Optional[float]] = []
-        self.last_update_time = None
+        self.last_update_time: Optional[float] = None  # Epoch seconds of the last drawn frame
         self.logging_active = False
         self.last_log_time = None
         self.initialized = False
@@ -68,27 +172,84 @@ class EpaperDisplay:
         self.flash_ticks: int = 0  # Remaining flash cycles for channel highlight
         self.flash_phase: bool = False  # Toggle state for flashing effect
         self.time_range_hours: float = 1.0  # Time range for graph (1, 2, 0.25, 0.5 hours)
+        self.title = "Temperature Logger"  # Header text; change with set_title()
+        self._base_bytes: Optional[bytes] = None  # Packed pixels of the static header (title + separator)
+        # Persistent frame canvas reused by every update (created once fonts are loaded)
+        self._canvas: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
+        self._fast_buffer_ok: Optional[bool] = None  # NumPy packer validated against driver on first use
+        # Thermocouple type labels, refreshed when settings_manager.revision changes
+        self._tc_types_cache: Optional[Tuple[str, ...]] = None
+        self._tc_types_version: Optional[int] = None
+        # Enabled channel indices, refreshed with the same revision check
+        self._enabled_cache: Optional[Tuple[int, ...]] = None
+        self._enabled_version: Optional[int] = None
+        self._enabled_count: int = 0
+        # Row layout per enabled channel count: (x_label, x_value, x_unit, y, y_unit, y_tc, y_style)
+        self._cell_positions: Dict[int, List[Tuple[int, int, int, int, int, int, int]]] = {}
+        # Fonts and per-row label/geometry plan, keyed by the tuple of enabled channel indices
+        self._plan_cache: Dict[Tuple[int, ...], tuple] = {}
+        # (config key, packed pixels) of header + static row content for the current config
+        self._static_bg: Optional[Tuple[tuple, bytes]] = None
+        # Pre-rasterized text masks keyed by (font, text) and per-font digit atlases
+        self._text_cache: Dict[tuple, Tuple[Image.Image, int, int]] = {}
+        self._digit_glyphs: Dict[tuple, Dict[str, Tuple[Image.Image, int, int, float]]] = {}
+        # Whole value strings composed from the atlas, keyed by (font, text)
+        self._value_runs: Dict[tuple, Tuple[Image.Image, int, int]] = {}
+        self._last_draw_key: Optional[tuple] = None  # State of the last frame pushed to the panel
+        self._drawn_readings: Optional[tuple] = None  # Readings shown in that frame
+        self._last_image: Optional[Image.Image] = None  # That frame, returned again when skipping
+        self.change_epsilon: float = 0.05  # °C; smaller moves don't trigger a refresh
+        # "HH:MM:SS" of the last drawn frame, reformatted only when the whole second changes
+        self._last_ts_sec: Optional[int] = None
+        self._last_ts_text = ""
+        # "Last log: HH:MM:SS" for the last_log_time it was formatted from
+        self._last_log_dt: Optional[datetime] = None
+        self._last_log_text = ""
+        # SPI clock from settings_manager.epd_spi_hz, reapplied after every epd.init*();
+        # None = keep the driver default. A clock the panel cannot follow raises no error,
+        # it only corrupts frames, so a raised clock is opt-in.
+        self._spi_speed_hz: Optional[int] = int(getattr(settings_manager, "epd_spi_hz", 0) or 0) or None
+        # Partial refreshes run on a single worker so SPI transfer overlaps the next frame
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self._refresh_future: Optional[Future] = None
+        # Latest-wins hand-off: a frame built while the panel is busy waits here,
+        # replacing any older waiting frame. Both fields are guarded by _pending_lock.
+        self._pending_lock = threading.Lock()
+        self._pending_frame: Optional[tuple] = None
+        self._refresh_active = False
+        self._epd_lock = threading.Lock()  # Serializes panel access with the refresh worker
+        # Rate limit for display_readings error logging (monotonic seconds)
+        self._last_error_log = -ERROR_LOG_INTERVAL
+        self._suppressed_errors = 0
+        # Reused packing buffers: full frame (height x width/8) and the refresh window bytes.
+        # Safe to overwrite because a new frame is only built once the previous refresh is done.
+        self._frame_np: Optional[np.ndarray] = None
+        self._window_buf: Optional[bytearray] = None
+        # (window, packed bytes) last sent to the panel, used to send only the changed
+        # rectangle. Owned by whoever holds _epd_lock; None forces a full-window send.
+        self._panel_window: Optional[Tuple[Tuple[int, int, int, int], np.ndarray]] = None
 
-        print(f"[EPAPER] EpaperDisplay __init__, HAS_EPAPER={HAS_EPAPER}")
-        
         if HAS_EPAPER:
             self._init_epaper()
         else:
-            print("[EPAPER] waveshare_epd not available, e-paper display disabled")
+            logger.info("waveshare_epd not available, e-paper display disabled")
 
     def _init_epaper(self) -> None:
         """Initialize e-paper display and fonts."""
         try:
-            print("[EPAPER] Starting initialization...")
-            logging.info("Initializing e-paper display...")
+            logger.info("Initializing e-paper display (Pillow %s)...", PIL.__version__)
             self.epd = epd7in5_V2.EPD()
-            print("[EPAPER] EPD object created")
+            self._install_bulk_spi()
+            self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="epaper")
+            logger.debug("EPD object created")
             
             self.epd.init()
-            print("[EPAPER] EPD init() called")
+            self._apply_spi_speed()
+            logger.debug("EPD init() called")
             
             self.epd.Clear()
-            print("[EPAPER] EPD cleared")
+            logger.debug("EPD cleared")
 
             # Load fonts
             # Standard fonts for headers and labels
@@ -97,11 +258,11 @@ class EpaperDisplay:
                 self.font_path_normal = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
                 self.font_path_oblique = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf"
 
-                self.font_large = ImageFont.truetype(self.font_path_bold, 32)
-                self.font_medium = ImageFont.truetype(self.font_path_normal, 32)
-                self.font_small = ImageFont.truetype(self.font_path_normal, 18)
-                self.font_unit = ImageFont.truetype(self.font_path_normal, 20)
-                self.font_tc_type = ImageFont.truetype(self.font_path_oblique, 14)
+                self.font_large = _load_font(self.font_path_bold, 32)
+                self.font_medium = _load_font(self.font_path_normal, 32)
+                self.font_small = _load_font(self.font_path_normal, 18)
+                self.font_unit = _load_font(self.font_path_normal, 20)
+                self.font_tc_type = _load_font(self.font_path_oblique, 14)
             except:
                 # Fallback to default font
                 self.font_large = ImageFont.load_default()
@@ -114,81 +275,124 @@ class EpaperDisplay:
                 self.font_path_oblique = None
 
             # Load Digital-7 Mono font for temperature values only
-            # Get the project root directory (parent of backend/)
-            project_root = Path(__file__).parent.parent
-            
-            font_path_options = [
-                project_root / "fonts" / "Digital-7-Mono.ttf",
-                project_root / "fonts" / "Digital-7 Mono.ttf",
-                project_root / "fonts" / "digital-7-mono.ttf",
-                Path.home() / ".local/share/fonts/digital-7-Mono.ttf",  # User fonts (~/.)
-                "/home/pi/ThermoLogger/fonts/Digital-7-Mono.ttf",  # Local project fonts on Pi
-                "/home/pi/.local/share/fonts/Digital-7-Mono.ttf",  # Raspberry Pi user fonts
-                "/usr/local/share/fonts/Digital-7-Mono.ttf",  # System-wide fonts
-                "/usr/share/fonts/truetype/Digital-7-Mono.ttf",
-            ]
-
-            font_path = None
-            for path in font_path_options:
-                if Path(path).exists():
-                    font_path = str(path)
-                    logging.info(f"Loaded Digital-7-Mono font from: {font_path}")
-                    print(f"[EPAPER] Loaded Digital-7-Mono font from: {font_path}")
-                    break
-
+            font_path = _find_digital_font()
             if font_path:
+                logger.info("Loaded Digital-7-Mono font from: %s", font_path)
                 self.font_path_digital = font_path
-                self.font_digital_large = ImageFont.truetype(font_path, 72)
-                self.font_digital_medium = ImageFont.truetype(font_path, 60)
+                self.font_digital_large = _load_font(font_path, 72)
+                self.font_digital_medium = _load_font(font_path, 60)
             else:
                 # Fallback to default font for temps too
-                logging.warning("Digital-7-Mono font not found, using default font for temperatures")
-                print("[EPAPER] Digital-7-Mono font not found, using default font for temperatures")
+                logger.warning("Digital-7-Mono font not found, using default font for temperatures")
                 self.font_digital_large = ImageFont.load_default()
                 self.font_digital_medium = ImageFont.load_default()
                 self.font_path_digital = None
 
+            # Rasterize the value digits once so updates only paste bitmaps
+            self._get_digit_glyphs(self.font_digital_medium)
+
+            # One canvas for the lifetime of the display; updates wipe only the dynamic areas
+            self._canvas = Image.new("1", (self.width, self.height), 255)
+            self._draw = ImageDraw.Draw(self._canvas)
+
             self.available = True
-            logging.info("E-paper display initialized successfully")
-            print("[EPAPER] Initialization complete - display is available")
+            logger.info("E-paper display initialized successfully")
         except Exception as e:
-            logging.warning(f"E-paper display not available: {e}")
-            print(f"[EPAPER ERROR] Initialization failed: {e}")
+            logger.warning("E-paper display not available: %s", e)
             self.available = False
 
-    def init_display(self, title: str = "Temperature Logger") -> None:
+    def _apply_spi_speed(self) -> None:
+        """Apply the configured SPI clock; every epd.init*() resets it to the driver default."""
+        if not self._spi_speed_hz:
+            return
+        try:
+            epdconfig.SPI.max_speed_hz = self._spi_speed_hz
+        except Exception as e:
+            logger.warning("Could not set SPI speed to %d Hz: %s", self._spi_speed_hz, e)
+            self._spi_speed_hz = None
+
+    def _install_bulk_spi(self) -> None:
+        """Route EPD data writes through spidev's writebytes2 in one call per payload.
+
+        The stock send_data clocks one byte per Python call. Whole buffers
+        (bytes, bytearray, lists) are handed to writebytes2, which accepts
+        buffer objects directly and chunks them to the spidev transfer size.
+        """
+        spi = getattr(epdconfig, "SPI", None)
+        if spi is None or not hasattr(spi, "writebytes2"):
+            logger.info("spidev writebytes2 unavailable, keeping per-byte EPD writes")
+            return
+
+        epd = self.epd
+        single_byte = epd.send_data
+
+        def send_bulk(data):
+            epdconfig.digital_write(epd.dc_pin, 1)
+            epdconfig.digital_write(epd.cs_pin, 0)
+            spi.writebytes2(data)
+            epdconfig.digital_write(epd.cs_pin, 1)
+
+        def send_data(data):
+            if isinstance(data, int):
+                single_byte(data)
+            else:
+                send_bulk(data)
+
+        epd.send_data = send_data
+        epd.send_data2 = send_bulk
+
+    def init_display(self, title: Optional[str] = None) -> None:
         """Initialize the display with static header (title, timestamp line, separator)."""
         if not self.available or not self.epd:
             return
+        if title is not None:
+            self.title = title
 
         try:
             # Load unplugged icon if not already loaded
             if self.unplugged_icon is None:
                 self._load_unplugged_icon()
             
-            # Create full image with header
-            image = Image.new("1", (self.width, self.height), 255)  # White background
-            draw = ImageDraw.Draw(image)
+            # Draw the header once into the persistent canvas
+            image = self._canvas
+            draw = self._draw
+            draw.rectangle((0, 0, self.width - 1, self.height - 1), fill=255)  # White background
 
             # Draw title
-            draw.text((10, 10), title, font=self.font_large, fill=0)
+            draw.text((10, 10), self.title, font=self.font_large, fill=0)
 
             # Draw horizontal line
             draw.line((10, 95, self.width - 10, 95), fill=0, width=2)
 
-            # Do a full refresh for initial setup with init_fast (faster than init)
-            self.epd.init_fast()
-            self.epd.display(self.epd.getbuffer(image))
-            
-            # Now switch to partial mode for future updates
-            self.epd.init_part()
+            # Keep the header's raw pixels so each update can restore the canvas in one memcpy
+            self._base_bytes = image.tobytes()
+            self._static_bg = None
+
+            self._wait_for_refresh()
+            with self._epd_lock:
+                # Do a full refresh for initial setup with init_fast (faster than init)
+                self.epd.init_fast()
+                self._apply_spi_speed()
+                self.epd.display(bytearray(self._fast_getbuffer(image)))
+                self._panel_window = None
+
+                # Now switch to partial mode for future updates
+                self.epd.init_part()
+                self._apply_spi_speed()
             self.partial_mode_active = True
             self.initialized = True
-            logging.info("E-paper display header initialized and switched to partial mode")
-            print("[EPAPER] Display initialized, switched to partial update mode")
+            self._last_draw_key = None
+            logger.info("E-paper display header initialized and switched to partial mode")
         except Exception as e:
-            logging.error(f"Error initializing e-paper display: {e}")
-            print(f"[EPAPER ERROR] {e}")
+            logger.error("Error initializing e-paper display: %s", e)
+
+    def set_title(self, title: str) -> None:
+        """Change the header title; the cached header is rebuilt on the next update."""
+        if title == self.title:
+            return
+        self.title = title
+        self._base_bytes = None
+        self.initialized = False
 
     def set_logging_status(self, is_logging: bool, last_log_time=None, message: Optional[str] = None):
         """Set the logging status to display on screen."""
@@ -199,13 +403,172 @@ class EpaperDisplay:
         self.status_message = message
 
     def set_history(self, history):
-        """Set history deque for plotting (expects list of (datetime, readings))."""
-        self.history = list(history) if history else []
+        """Set history deque for plotting (expects list of (datetime, readings)).
+
+        Samples are mirrored into NumPy arrays for the plot: epoch seconds in
+        _hist_t and an (N, channels) float array in _hist_v. The
+        caller only appends on the right and drops on the left, so normally
+        just the new tail is converted.
+        """
+        self.history = history if history else []
+        if not self.history:
+            self._last_plot = None
+            self._hist_reset(np.empty(0), np.empty((0, 0)))
+            self._hist_last_ts = None
+            self._bkt_width = None
+            return
+
+        last_ts = self._hist_last_ts
+        if last_ts is not None and len(self._hist_t):
+            tail = []
+            for item in reversed(self.history):
+                if item[0] <= last_ts:
+                    break
+                tail.append(item)
+            if len(tail) < len(self.history):
+                tail.reverse()
+                if not tail or self._hist_append(self._history_times(tail),
+                                                 self._history_values(tail)):
+                    # Drop what the caller dropped on the left
+                    self._hist_start = max(self._hist_start, self._hist_end - len(self.history))
+                    self._hist_views()
+                    self._hist_last_ts = self.history[-1][0]
+                    return
+
+        self._hist_reset(self._history_times(self.history), self._history_values(self.history))
+        self._hist_last_ts = self.history[-1][0]
+        self._bkt_width = None  # Samples replaced wholesale: rebuild the plot buckets
+
+    def push_history(self, ts: datetime, readings) -> None:
+        """Append one (timestamp, readings) sample to the plot history.
+
+        Cheaper than set_history for a caller that records samples one at a
+        time: one row is written into the preallocated buffer. Only the newest
+        HISTORY_CAPACITY samples are kept.
+        """
+        t = np.array([ts.timestamp()])
+        v = self._history_values([(ts, readings)])
+        if not self._hist_append(t, v):
+            # Channel count changed: start over with the new layout
+            self._hist_reset(t, v)
+            self._bkt_width = None
+        self._hist_last_ts = ts
+
+    def _hist_append(self, t: np.ndarray, v: np.ndarray) -> bool:
+        """Append rows to the history buffers; False if the channel count differs."""
+        if v.shape[1] != self._hist_vbuf.shape[1] and self._hist_end > self._hist_start:
+            return False
+        if v.shape[1] != self._hist_vbuf.shape[1] or self._hist_end + len(t) > len(self._hist_tbuf):
+            # Out of room: move the newest rows to the front (amortized O(1) per sample)
+            keep = HISTORY_CAPACITY - min(len(t), HISTORY_CAPACITY)
+            n_old = min(keep, self._hist_end - self._hist_start)
+            if n_old:
+                t = np.concatenate((self._hist_t[-n_old:], t))
+                v = np.concatenate((self._hist_v[-n_old:], v))
+            self._hist_reset(t, v)
+            return True
+        end = self._hist_end + len(t)
+        self._hist_tbuf[self._hist_end:end] = t
+        self._hist_vbuf[self._hist_end:end] = v
+        self._hist_end = end
+        self._hist_start = max(self._hist_start, end - HISTORY_CAPACITY)
+        self._hist_views()
+        return True
+
+    def _hist_reset(self, t: np.ndarray, v: np.ndarray) -> None:
+        """Replace the history buffers with the newest HISTORY_CAPACITY rows of t/v."""
+        t, v = t[-HISTORY_CAPACITY:], v[-HISTORY_CAPACITY:]
+        capacity = 2 * HISTORY_CAPACITY
+        if len(self._hist_tbuf) != capacity or self._hist_vbuf.shape[1:] != v.shape[1:]:
+            self._hist_tbuf = np.empty(capacity)
+            self._hist_vbuf = np.empty((capacity,) + v.shape[1:])
+        self._hist_tbuf[:len(t)] = t
+        self._hist_vbuf[:len(v)] = v
+        self._hist_start, self._hist_end = 0, len(t)
+        self._hist_views()
+
+    def _hist_views(self) -> None:
+        """Point _hist_t/_hist_v at the live rows of the history buffers."""
+        self._hist_t = self._hist_tbuf[self._hist_start:self._hist_end]
+        self._hist_v = self._hist_vbuf[self._hist_start:self._hist_end]
+
+    def _plot_buckets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (bucket ids, per-bucket mean) covering the plot range.
+
+        Buckets are range / PLOT_BUCKETS wide and aligned to absolute time, so a
+        sample always falls in the same bucket and each call only folds in the
+        samples added since the last one.
+        """
+        t, v = self._hist_t, self._hist_v
+        range_s = self.time_range_hours * 3600.0
+        bw = range_s / PLOT_BUCKETS
+        if not len(t):
+            return self._bkt_ids[:0], self._bkt_sum[:0]
+
+        if self._bkt_width != bw or self._bkt_sum.shape[1:] != v.shape[1:]:
+            start = int(np.searchsorted(t, t[-1] - range_s - bw, side="left"))
+            self._bkt_ids, self._bkt_sum, self._bkt_cnt = self._reduce_buckets(t[start:], v[start:], bw)
+            self._bkt_width = bw
+        else:
+            start = int(np.searchsorted(t, self._bkt_t_end, side="right"))
+            ids, sums, counts = self._reduce_buckets(t[start:], v[start:], bw)
+            if len(ids) and len(self._bkt_ids) and ids[0] == self._bkt_ids[-1]:
+                # First new samples land in the newest existing bucket: merge them
+                self._bkt_sum[-1] += sums[0]
+                self._bkt_cnt[-1] += counts[0]
+                ids, sums, counts = ids[1:], sums[1:], counts[1:]
+            if len(ids):
+                self._bkt_ids = np.concatenate((self._bkt_ids, ids))
+                self._bkt_sum = np.concatenate((self._bkt_sum, sums))
+                self._bkt_cnt = np.concatenate((self._bkt_cnt, counts))
+
+        # Drop buckets that have scrolled out of the plot range
+        keep = int(np.searchsorted(self._bkt_ids, math.floor((t[-1] - range_s) / bw) - 1, side="left"))
+        if keep:
+            self._bkt_ids = self._bkt_ids[keep:]
+            self._bkt_sum = self._bkt_sum[keep:]
+            self._bkt_cnt = self._bkt_cnt[keep:]
+        self._bkt_t_end = t[-1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(self._bkt_cnt > 0, self._bkt_sum / self._bkt_cnt, np.nan)
+        return self._bkt_ids, means
+
+    @staticmethod
+    def _reduce_buckets(t: np.ndarray, v: np.ndarray, bw: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Group sorted samples into time buckets of width bw: (ids, sums, counts), NaNs skipped."""
+        if not len(t):
+            return np.empty(0, dtype=np.int64), np.empty((0,) + v.shape[1:]), np.empty((0,) + v.shape[1:])
+        ids = np.floor(t / bw).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        valid = ~np.isnan(v)
+        sums = np.add.reduceat(np.where(valid, v, 0.0), starts, axis=0)
+        counts = np.add.reduceat(valid.astype(float), starts, axis=0)
+        return ids[starts], sums, counts
+
+    @staticmethod
+    def _history_times(history) -> np.ndarray:
+        """Return the history timestamps as epoch seconds."""
+        return np.array([ts.timestamp() for ts, _ in history], dtype=float)
+
+    @staticmethod
+    def _history_values(history) -> np.ndarray:
+        """Stack history readings into a float array; missing channels become NaN."""
+        try:
+            return np.array([vals for _, vals in history], dtype=float).reshape(len(history), -1)
+        except (TypeError, ValueError):
+            # Rows of different length (channel count changed) or non-numeric entries
+            width = max(len(vals) for _, vals in history)
+            out = np.full((len(history), width), np.nan)
+            for row, (_, vals) in enumerate(history):
+                for ch, v in enumerate(vals):
+                    if isinstance(v, (int, float)):
+                        out[row, ch] = v
+            return out
 
     def set_time_range(self, hours: float):
         """Set the time range for the graph (in hours)."""
         self.time_range_hours = hours
-        print(f"[EPAPER] Graph time range set to {hours} hour(s)")
+        logger.debug("Graph time range set to %s hour(s)", hours)
 
     def start_flash_channels(self, cycles: int = 6):
         """Start a short flashing effect on channel labels during checks."""
@@ -217,15 +580,220 @@ class EpaperDisplay:
         self.flash_ticks = 0
         self.flash_phase = False
 
+    def _get_cell_positions(self, enabled_count: int) -> List[Tuple[int, int, int, int, int, int, int]]:
+        """Return cached screen coordinates for each displayed row."""
+        positions = self._cell_positions.get(enabled_count)
+        if positions is None:
+            # Vertical spacing to fit all enabled channels in one column
+            available_height = self.height - self.data_start_y - 10
+            row_spacing = max(40, min(70, available_height // max(1, enabled_count)))
+            x_pos = 20
+            positions = []
+            for row in range(enabled_count):
+                y_pos = self.data_start_y + row * row_spacing
+                positions.append((x_pos, x_pos + 150, x_pos + 320, y_pos, y_pos + 5, y_pos + 35, y_pos + 25))
+            self._cell_positions[enabled_count] = positions
+        return positions
+
+    def _get_row_plan(self, enabled_indices: Tuple[int, ...]):
+        """Return the cached draw plan for a set of enabled channels.
+
+        The plan is the row fonts plus, per row, the channel index, the
+        pre-rendered "CH N:" label mask and its box, the line style indicator
+        and the cell coordinates; frames only vary the values drawn into it.
+        """
+        plan = self._plan_cache.get(enabled_indices)
+        if plan is None:
+            fonts = self._select_fonts(len(enabled_indices))
+            cells = self._get_cell_positions(len(enabled_indices))
+            rows = []
+            for display_idx, (idx, cell) in enumerate(zip(enabled_indices, cells)):
+                x_pos, y_pos = cell[0], cell[3]
+                mask, dx, dy = self._text_mask(f"CH {idx + 1}:", fonts[0])
+                label_box = (x_pos + dx, y_pos + dy, x_pos + dx + mask.width, y_pos + dy + mask.height)
+                style_indicator = LINESTYLE_SYMBOLS.get(display_idx % 5, '━')
+                rows.append((idx, mask, label_box, style_indicator, cell))
+                self._text_mask(style_indicator, self.font_small)
+            # Warm the text/glyph caches so steady-state frames never touch FreeType
+            self._text_mask(UNIT_TEXT, fonts[1])
+            if self.settings_manager:
+                for tc_type in set(self._get_tc_types(max(enabled_indices, default=-1) + 1)):
+                    self._text_mask(tc_type, fonts[2])
+            self._get_digit_glyphs(fonts[3])
+            plan = (fonts, rows)
+            self._plan_cache[enabled_indices] = plan
+        return plan
+
+    def _draw_static_rows(self, image: Image.Image, rows, font_unit, font_tc, tc_types, flash_inverted: bool) -> None:
+        """Draw everything in the reading rows except the values themselves.
+
+        Labels (inverted on flash phases), unplugged icons or line style markers
+        (hidden while flashing), units and thermocouple types.
+        """
+        for idx, label_mask, label_box, style_indicator, cell in rows:
+            x_pos, x_value, x_unit, y_pos_current, y_unit, y_tc, y_style = cell
+
+            # Flash effect: invert label on alternating phases. The mask itself is
+            # the inverted label (white ink on black), so it is pasted as the source
+            if flash_inverted:
+                image.paste(label_mask, label_box)
+            else:
+                image.paste(0, label_box, label_mask)
+
+            # Add unplugged icon or line style indicator below channel label
+            if self.flash_ticks == 0:
+                if (idx + 1) in self.unplugged_channels:
+                    if self.unplugged_icon:
+                        try:
+                            icon_w, icon_h = self.unplugged_icon.size
+                            # Just right of the label, vertically centred on it
+                            icon_x = x_pos + (label_box[2] - label_box[0]) + 6
+                            label_height = label_box[3] - label_box[1]
+                            icon_y = y_pos_current + max(0, (label_height - icon_h) // 2)
+                            image.paste(self.unplugged_icon, (icon_x, icon_y))
+                        except Exception as e:
+                            logger.warning("Error pasting unplugged icon: %s", e)
+                else:
+                    self._paste_text(image, (x_pos, y_style), style_indicator, self.font_small)
+
+            self._paste_text(image, (x_unit, y_unit), UNIT_TEXT, font_unit)
+
+            if tc_types:
+                self._paste_text(image, (x_unit, y_tc), tc_types[idx], font_tc)
+
+    def _get_enabled_indices(self, count: int) -> Tuple[int, ...]:
+        """Return the cached tuple of enabled channel indices, rebuilt only when settings change."""
+        if not self.settings_manager:
+            return tuple(range(count))
+        version = getattr(self.settings_manager, "revision", None)
+        cache = self._enabled_cache
+        if cache is None or version is None or version != self._enabled_version or self._enabled_count != count:
+            cache = tuple(i for i in range(count) if self.settings_manager.is_channel_enabled(i))
+            self._enabled_cache = cache
+            self._enabled_version = version
+            self._enabled_count = count
+        return cache
+
+    def invalidate_channel_config(self) -> None:
+        """Drop cached channel enable/type state; call after changing channel settings."""
+        self._enabled_cache = None
+        self._tc_types_cache = None
+        self._plan_cache.clear()
+        self._static_bg = None
+
+    def _get_tc_types(self, count: int) -> Tuple[str, ...]:
+        """Return cached thermocouple type labels, rebuilt only when settings change."""
+        version = getattr(self.settings_manager, "revision", None)
+        cache = self._tc_types_cache
+        if cache is None or version is None or version != self._tc_types_version or len(cache) < count:
+            cache = tuple(self.settings_manager.get_channel_type(i) for i in range(count))
+            self._tc_types_cache = cache
+            self._tc_types_version = version
+        return cache
+
     def _make_font(self, path: Optional[str], size: int, fallback) -> ImageFont.FreeTypeFont:
         """Create a font from path if available, otherwise fallback."""
         if path:
             try:
-                return ImageFont.truetype(path, size)
+                return _load_font(path, size)
             except Exception:
                 pass
         return fallback
 
+    @staticmethod
+    def _font_key(font) -> tuple:
+        """Return a stable cache key for a font (path + size when available)."""
+        path = getattr(font, "path", None)
+        size = getattr(font, "size", None)
+        if path and size:
+            return (str(path), size)
+        return (id(font),)
+
+    def _text_mask(self, text: str, font) -> Tuple[Image.Image, int, int]:
+        """Return a cached 1-bit mask for text plus its offset from the draw origin."""
+        key = (self._font_key(font), text)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            left, top, right, bottom = font.getbbox(text)
+            mask = Image.new("1", (max(1, right - left), max(1, bottom - top)), 0)
+            ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+            cached = (mask, left, top)
+            self._text_cache[key] = cached
+        return cached
+
+    def _paste_text(self, image: Image.Image, pos, text: str, font, fill: int = 0):
+        """Blit cached text onto image at pos, equivalent to draw.text; returns its bbox."""
+        mask, dx, dy = self._text_mask(text, font)
+        x0 = pos[0] + dx
+        y0 = pos[1] + dy
+        box = (x0, y0, x0 + mask.width, y0 + mask.height)
+        image.paste(fill, box, mask)
+        return box
+
+    def _get_digit_glyphs(self, font) -> Dict[str, Tuple[Image.Image, int, int, float]]:
+        """Return the glyph atlas (mask, dx, dy, advance) for font, building it on first use."""
+        key = self._font_key(font)
+        glyphs = self._digit_glyphs.get(key)
+        if glyphs is None:
+            glyphs = {}
+            for ch in DIGIT_GLYPHS:
+                glyphs[ch] = self._render_glyph(ch, font)
+            self._digit_glyphs[key] = glyphs
+        return glyphs
+
+    @staticmethod
+    def _render_glyph(ch: str, font) -> Tuple[Image.Image, int, int, float]:
+        """Rasterize one glyph against the font baseline so all digits line up."""
+        try:
+            ascent = font.getmetrics()[0]
+            left, top, right, bottom = font.getbbox(ch, anchor="ls")
+            anchor = "ls"
+        except (AttributeError, TypeError, ValueError):
+            # Bitmap fonts do not support anchors; fall back to top-left placement
+            ascent = 0
+            left, top, right, bottom = font.getbbox(ch)
+            anchor = None
+        mask = Image.new("1", (max(1, right - left), max(1, bottom - top)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), ch, font=font, fill=255, anchor=anchor)
+        return mask, left, ascent + top, font.getlength(ch)
+
+    def _paste_digits(self, image: Image.Image, pos, text: str, font):
+        """Paste a numeric string as one cached run composed from the digit atlas."""
+        key = (self._font_key(font), text)
+        run = self._value_runs.get(key)
+        if run is None:
+            if len(self._value_runs) >= VALUE_RUN_CACHE_SIZE:
+                self._value_runs.clear()
+            run = self._value_runs[key] = self._compose_digits(text, font)
+        mask, dx, dy = run
+        x0 = pos[0] + dx
+        y0 = pos[1] + dy
+        image.paste(0, (x0, y0, x0 + mask.width, y0 + mask.height), mask)
+
+    def _compose_digits(self, text: str, font) -> Tuple[Image.Image, int, int]:
+        """Compose text from the digit atlas into one mask plus its offset from the origin."""
+        glyphs = self._get_digit_glyphs(font)
+        placed = []
+        cursor = 0.0
+        for ch in text:
+            glyph = glyphs.get(ch)
+            if glyph is None:
+                # Unexpected character (e.g. "inf"); add it to the atlas lazily
+                glyph = glyphs[ch] = self._render_glyph(ch, font)
+            mask, dx, dy, advance = glyph
+            placed.append((mask, int(cursor) + dx, dy))
+            cursor += advance
+        if not placed:
+            return Image.new("1", (1, 1), 0), 0, 0
+        left = min(x for _, x, _ in placed)
+        top = min(y for _, _, y in placed)
+        right = max(x + m.width for m, x, _ in placed)
+        bottom = max(y + m.height for m, _, y in placed)
+        run = Image.new("1", (right - left, bottom - top), 0)
+        for mask, x, y in placed:
+            run.paste(255, (x - left, y - top, x - left + mask.width, y - top + mask.height), mask)
+        return run, left, top
+
     def _select_fonts(self, enabled_count: int):
         """Select fonts dynamically based on how many channels are displayed."""
         # Default sizes
@@ -253,8 +821,8 @@ class EpaperDisplay:
         return font_medium, font_unit, font_tc, font_digital
 
     def _draw_plot(self, draw: ImageDraw.ImageDraw, enabled_indices: List[int], x: int, y: int, w: int, h: int):
-        """Draw matplotlib plot for enabled channels (excluding unplugged) using configured time range."""
-        if not self.history or not enabled_indices:
+        """Draw the plot for enabled channels (excluding unplugged) using configured time range."""
+        if not len(self._hist_t) or not enabled_indices:
             return None
 
         # Filter out unplugged channels from the plot
@@ -263,32 +831,39 @@ class EpaperDisplay:
         if not plot_indices:
             return None
 
-        cutoff = datetime.now() - timedelta(hours=self.time_range_hours)
-        series_times = []
-        series_values = [[] for _ in plot_indices]
-
-        for ts, vals in self.history:
-            if ts >= cutoff:
-                series_times.append(ts)
-                for si, ch in enumerate(plot_indices):
-                    if ch < len(vals):
-                        v = vals[ch]
-                        if isinstance(v, (int, float)):
-                            v = max(0, min(150, v))
-                        series_values[si].append(v)
-                    else:
-                        series_values[si].append(float("nan"))
-
-        if not series_times:
+        # The plot moves about a pixel every few seconds; reuse the last render in between
+        plot_key = (w, h, tuple(plot_indices), self.time_range_hours)
+        render_time = time.time()
+        cached = self._last_plot
+        if cached is not None and cached[0] == plot_key and 0 <= render_time - cached[1] < self._plot_interval():
+            return cached[2], x, y
+        self._last_plot = None
+
+        now = datetime.now()
+        time_ago = now - timedelta(hours=self.time_range_hours)
+        t_now, t_cutoff = now.timestamp(), time_ago.timestamp()
+
+        # Plot one averaged point per time bucket (about one per pixel column)
+        # instead of every sample, placed at the bucket centre
+        ids, means = self._plot_buckets()
+        start = int(np.searchsorted(ids, math.floor(t_cutoff / self._bkt_width), side="left")) if len(ids) else 0
+        if start >= len(ids):
             return None
+        series_times = (ids[start:] + 0.5) * self._bkt_width
+        bucket_values = means[start:]
+        values = np.full((len(series_times), len(plot_indices)), np.nan)
+        width = bucket_values.shape[1]
+        cols = [si for si, ch in enumerate(plot_indices) if ch < width]
+        if cols:
+            values[:, cols] = bucket_values[:, [plot_indices[si] for si in cols]]
+        values = np.clip(values, 0, 150)
 
         # Dynamic temp scale: +5°C above max, -5°C below min, rounded to nearest 5
-        flat_vals = [v for series in series_values for v in series if isinstance(v, (int, float)) and not math.isnan(v)]
-        if not flat_vals:
+        if np.isnan(values).all():
             return None
-        
-        data_min = min(flat_vals)
-        data_max = max(flat_vals)
+
+        data_min = float(np.nanmin(values))
+        data_max = float(np.nanmax(values))
         # Round to nearest 5: floor(min-5) to nearest 5, ceil(max+5) to nearest 5
         vmin = int(math.floor((data_min - 5) / 5) * 5)
         vmax = int(math.ceil((data_max + 5) / 5) * 5)
@@ -296,67 +871,117 @@ class EpaperDisplay:
         vmin = max(0, vmin)
         vmax = min(150, vmax)
 
-        # Create matplotlib figure with fixed subplot positioning
-        dpi = 100
-        fig = Figure(figsize=(w/dpi, h/dpi), dpi=dpi, facecolor='white')
-        ax = fig.add_subplot(111)
-        
-        # Line styles for each channel
-        linestyles = ['-', ':', '--', '-.', (0, (3, 1, 1, 1, 1, 1))]
-        
-        # Plot each enabled channel (excluding unplugged)
-        for si, ch_idx in enumerate(plot_indices):
-            style = linestyles[si % len(linestyles)]
-            ax.plot(series_times, series_values[si], 
-                   linestyle=style, 
-                   color='black', 
-                   linewidth=1.5,
-                   label=f'CH{ch_idx + 1}')
-        
-        # Configure axes
-        ax.set_ylim(vmin, vmax)
-        
-        # Fix x-axis to configured time range
-        now = datetime.now()
-        time_ago = now - timedelta(hours=self.time_range_hours)
-        ax.set_xlim(time_ago, now)
-        
-        ax.set_ylabel('Temperature (°C)', fontsize=8)
-        ax.set_xlabel('Time', fontsize=8)
-        ax.tick_params(axis='both', labelsize=7)
-        
-        # Set y-axis ticks every 5 degrees
-        import numpy as np
-        y_ticks = np.arange(vmin, vmax + 1, 5)
-        ax.set_yticks(y_ticks)
-        
-        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
-        
-        # Format time axis to show clock times (HH:MM)
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        # Set tick interval based on time range
-        if self.time_range_hours <= 0.25:  # 15 min
-            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=3))
-        elif self.time_range_hours <= 0.5:  # 30 min
-            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
-        elif self.time_range_hours <= 1.0:  # 1 hour
-            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
-        else:  # 2+ hours
-            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=30))
-        fig.autofmt_xdate(rotation=0, ha='center')
-        
-        # Use subplots_adjust for consistent positioning instead of tight_layout
-        fig.subplots_adjust(left=0.12, right=0.95, top=0.95, bottom=0.15)
-        
-        # Render to PIL Image
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=dpi, facecolor='white', edgecolor='none')
-        buf.seek(0)
-        plot_img = Image.open(buf).convert('1')
-        plt.close(fig)
-        
+        plot_img = self._render_plot(w, h, series_times, values, t_cutoff, t_now, vmin, vmax)
+        self._last_plot = (plot_key, render_time, plot_img)
+
         return plot_img, x, y
 
+    def _plot_interval(self) -> float:
+        """Seconds a rendered plot is reused, from settings when available."""
+        interval = getattr(self.settings_manager, "plot_interval", None)
+        return PLOT_INTERVAL if interval is None else float(interval)
+
+    def _render_plot(self, w: int, h: int, times: np.ndarray, values: np.ndarray,
+                     t0: float, t1: float, vmin: int, vmax: int) -> Image.Image:
+        """Draw the plot into a 1-bit image with PIL.
+
+        Axes frame, dotted grid and ticks every 5 °C and every few minutes
+        (HH:MM labels), and one line per column of values in the dash style
+        of its row marker. Times are epoch seconds spanning t0..t1.
+        """
+        img = Image.new("1", (w, h), 255)
+        draw = ImageDraw.Draw(img)
+        left, top, right, bottom = (int(f * size) for f, size in zip(PLOT_AXES, (w, h, w, h)))
+        tick_font = self._make_font(self.font_path_normal, 10, self.font_small)
+        label_font = self._make_font(self.font_path_normal, 11, self.font_small)
+        x_scale = (right - left) / (t1 - t0)
+        y_scale = (bottom - top) / (vmax - vmin)
+
+        # Temperature ticks and grid every 5 degrees
+        for value in range(vmin, vmax + 1, 5):
+            py = round(bottom - (value - vmin) * y_scale)
+            draw.point([(px, py) for px in range(left, right, 6)], fill=0)
+            draw.line((left - 4, py, left, py), fill=0)
+            mask = self._text_mask(str(value), tick_font)[0]
+            self._paste_mask(img, mask, left - 6 - mask.width, py - mask.height // 2)
+
+        # Time ticks on whole minutes, spaced to suit the range
+        if self.time_range_hours <= 0.25:
+            step = 3
+        elif self.time_range_hours <= 0.5:
+            step = 5
+        elif self.time_range_hours <= 1.0:
+            step = 15
+        else:
+            step = 30
+        tick = datetime.fromtimestamp(t0).replace(second=0, microsecond=0)
+        tick += timedelta(minutes=-tick.minute % step)
+        if tick.timestamp() < t0:
+            tick += timedelta(minutes=step)
+        label_top = bottom + 7
+        while tick.timestamp() <= t1:
+            px = round(left + (tick.timestamp() - t0) * x_scale)
+            draw.point([(px, py) for py in range(top, bottom, 6)], fill=0)
+            draw.line((px, bottom, px, bottom + 4), fill=0)
+            mask = self._text_mask(tick.strftime("%H:%M"), tick_font)[0]
+            self._paste_mask(img, mask, px - mask.width // 2, label_top)
+            tick += timedelta(minutes=step)
+
+        # Axis titles
+        mask = self._text_mask("Time", label_font)[0]
+        self._paste_mask(img, mask, (left + right - mask.width) // 2, label_top + tick_font.size + 4)
+        mask = self._rotated_mask("Temperature (°C)", label_font)
+        self._paste_mask(img, mask, 2, (top + bottom - mask.height) // 2)
+
+        # Series, drawn inside the axes box so they are clipped to it. Each line is
+        # drawn solid into a scratch layer and masked with its style's stipple
+        size = (right - left, bottom - top)
+        ink = np.zeros((size[1], size[0]), dtype=bool)
+        layer = Image.new("1", size, 0)
+        layer_draw = ImageDraw.Draw(layer)
+        xs = (times - t0) * x_scale
+        for si in range(values.shape[1]):
+            ys = (vmax - values[:, si]) * y_scale
+            valid = ~np.isnan(ys)
+            # Break the line at missing readings
+            edges = np.flatnonzero(np.diff(np.r_[False, valid, False].astype(np.int8)))
+            layer_draw.rectangle((0, 0, size[0], size[1]), fill=0)
+            for a, b in zip(edges[::2], edges[1::2]):
+                layer_draw.line(list(zip(xs[a:b].tolist(), ys[a:b].tolist())), fill=255, width=2)
+            stipple = self._stipple(si % len(PLOT_DASHES), size[0])
+            if stipple is None:
+                ink |= np.asarray(layer)
+            else:
+                ink |= np.asarray(layer) & stipple
+        img.paste(0, (left, top, right, bottom), Image.fromarray(ink))
+        draw.rectangle((left, top, right, bottom), outline=0)
+        return img
+
+    def _stipple(self, style: int, width: int) -> Optional[np.ndarray]:
+        """Return the cached column mask for a dash style (None = solid), repeating across width."""
+        pattern = PLOT_DASHES[style]
+        if pattern is None:
+            return None
+        key = (style, width)
+        mask = self._stipples.get(key)
+        if mask is None:
+            period = np.repeat(np.arange(len(pattern)) % 2 == 0, pattern)
+            mask = self._stipples[key] = np.resize(period, width)
+        return mask
+
+    @staticmethod
+    def _paste_mask(image: Image.Image, mask: Image.Image, x: int, y: int) -> None:
+        """Paste black through a 1-bit mask with its top-left corner at (x, y)."""
+        image.paste(0, (x, y, x + mask.width, y + mask.height), mask)
+
+    def _rotated_mask(self, text: str, font) -> Image.Image:
+        """Return a cached text mask rotated 90° counter-clockwise (for the y-axis title)."""
+        key = (self._font_key(font), text, 90)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            cached = self._text_cache[key] = self._text_mask(text, font)[0].transpose(ROTATE_90)
+        return cached
+
     def set_unplugged_channels(self, unplugged: List[int]) -> None:
         """Set the list of unplugged channels to display."""
         self.unplugged_channels = unplugged
@@ -389,188 +1014,352 @@ class EpaperDisplay:
                 img.thumbnail((30, 24), Image.Resampling.LANCZOS)
                 # Store as 1-bit
                 self.unplugged_icon = img
-                logging.info(f"Loaded unplugged icon from: {icon_path}")
-                print(f"[EPAPER] Loaded unplugged icon: {icon_path}")
+                logger.debug("Loaded unplugged icon from: %s", icon_path)
             else:
-                logging.warning("Unplugged icon not found")
-                print("[EPAPER] Warning: unplugged.png not found")
+                logger.warning("Unplugged icon not found")
         except Exception as e:
-            logging.warning(f"Failed to load unplugged icon: {e}")
-            print(f"[EPAPER] Warning: Failed to load unplugged icon: {e}")
-
-    def display_readings(self, readings: List[float]):
+            logger.warning("Failed to load unplugged icon: %s", e)
+
+    def _frame_key(self, sec: int) -> tuple:
+        """Everything besides the readings that the frame depends on."""
+        return (
+            sec // 60,
+            self.status_message,
+            self.logging_active,
+            self.last_log_time,
+            self.time_range_hours,
+            tuple(self.unplugged_channels),
+            self.settings_manager.revision if self.settings_manager else None,
+            self.flash_ticks,
+            self.flash_phase,
+        )
+
+    def _readings_changed(self, readings: List[float]) -> bool:
+        """True if any reading moved by change_epsilon or more since the last drawn frame."""
+        last = self._drawn_readings
+        if last is None or len(last) != len(readings):
+            return True
+        eps = self.change_epsilon
+        for new, old in zip(readings, last):
+            new_ok = isinstance(new, (int, float)) and not math.isnan(new)
+            old_ok = isinstance(old, (int, float)) and not math.isnan(old)
+            if new_ok != old_ok or (new_ok and abs(new - old) >= eps):
+                return True
+        return False
+
+    def display_readings(self, readings: List[float], force: bool = False):
         """Update only temperature readings with partial refresh (fast update).
-        Returns the PIL Image that was displayed."""
+        Returns the PIL Image that was displayed. When nothing changed since the
+        last frame the panel is left alone and that frame is returned again
+        (pass force=True to redraw anyway)."""
         if not self.available or not self.epd:
             return None
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("display_readings called with %d readings", len(readings))
+
         try:
             self.last_readings = readings
-            self.last_update_time = datetime.now()
 
             # If not yet initialized, do full init first
             if not self.initialized:
+                self.last_update_time = time.time()
                 self.init_display()
                 return None  # Return after init, next call will do the update
-            
-            # Create full image (we need the full canvas for getbuffer)
-            image = Image.new("1", (self.width, self.height), 255)  # White background
-            draw = ImageDraw.Draw(image)
 
-            # Redraw the title (needed for full image buffer)
-            draw.text((10, 10), "Temperature Logger", font=self.font_large, fill=0)
+            # Skip the frame when no reading moved meaningfully and nothing else changed
+            now = time.time()
+            sec = int(now)
+            key = self._frame_key(sec)
+            if not force and key == self._last_draw_key and not self._readings_changed(readings):
+                return self._last_image
+            self._last_draw_key = key
+            self._drawn_readings = tuple(readings)
+            self.last_update_time = now
 
-            # Draw horizontal line
-            draw.line((10, 95, self.width - 10, 95), fill=0, width=2)
+            # Determine enabled channels
+            enabled_indices = self._get_enabled_indices(len(readings))
+
+            enabled_count = len(enabled_indices)
+            (font_medium, font_unit, font_tc, font_digital), rows = self._get_row_plan(enabled_indices)
+
+            # Layout split: left for values, right for plot (50/50 split)
+            left_width = int(self.width * 0.5)
+            right_available = self.width - left_width - 10
+            right_width = right_available  # Plot takes full available space
+            # Align plot to the right edge
+            plot_x = self.width - right_width - 10
+            # Plot height is full available height
+            plot_height = self.height - self.data_start_y - 10
+
+            # Format all values and look up thermocouple types once, outside the row loop
+            values = [_format_reading(r) for r in readings]
+            tc_types = self._get_tc_types(len(readings)) if self.settings_manager else None
+
+            # Reuse the persistent canvas. Outside flash cycles it is reset to the
+            # cached background (header plus labels, markers, units and TC types
+            # for this channel config), so only the values need drawing.
+            image = self._canvas
+            draw = self._draw
+            flashing = self.flash_ticks > 0
+            bg_key = (enabled_indices, tuple(self.unplugged_channels), tc_types, self.unplugged_icon is not None)
+            if not flashing and self._static_bg is not None and self._static_bg[0] == bg_key:
+                image.frombytes(self._static_bg[1])
+            else:
+                image.frombytes(self._base_bytes)
+                self._draw_static_rows(image, rows, font_unit, font_tc, tc_types, flashing and self.flash_phase)
+                if not flashing:
+                    self._static_bg = (bg_key, image.tobytes())
 
             # Draw timestamp in update region
-            timestamp = self.last_update_time.strftime("%H:%M:%S")
+            if sec != self._last_ts_sec:
+                self._last_ts_text = time.strftime("%H:%M:%S", time.localtime(sec))
+                self._last_ts_sec = sec
+            timestamp = self._last_ts_text
             draw.text((10, 65), f"Updated: {timestamp}", font=self.font_small, fill=0)
 
             # Draw logging status or custom message (paused/reset/etc.)
             status_text = self.status_message or ("Logging: ON" if self.logging_active else "Logging: OFF")
-            draw.text((250, 65), status_text, font=self.font_small, fill=0)
+            self._paste_text(image, (250, 65), status_text, self.font_small)
 
             # Show last log time when active, or when paused message is shown (helps indicate file not reset)
             show_last_log = self.logging_active or (self.status_message and "paused" in self.status_message.lower())
             if show_last_log and self.last_log_time:
-                log_time_text = f"Last log: {self.last_log_time.strftime('%H:%M:%S')}"
-                draw.text((450, 65), log_time_text, font=self.font_small, fill=0)
+                if self.last_log_time != self._last_log_dt:
+                    self._last_log_text = f"Last log: {self.last_log_time.strftime('%H:%M:%S')}"
+                    self._last_log_dt = self.last_log_time
+                draw.text((450, 65), self._last_log_text, font=self.font_small, fill=0)
             
             # Draw time range label on the same status line, positioned to the right
             if self.time_range_hours >= 1.0:
                 range_text = f"Range: {int(self.time_range_hours)}h"
             else:
                 range_text = f"Range: {int(self.time_range_hours * 60)}min"
-            draw.text((self.width - 150, 65), range_text, font=self.font_small, fill=0)
-
-            # Determine enabled channels
-            if self.settings_manager:
-                enabled_indices = [i for i in range(len(readings)) if self.settings_manager.is_channel_enabled(i)]
-            else:
-                enabled_indices = list(range(len(readings)))
-
-            enabled_count = len(enabled_indices)
-            font_medium, font_unit, font_tc, font_digital = self._select_fonts(enabled_count)
-
-            # Layout split: left for values, right for plot (50/50 split)
-            left_width = int(self.width * 0.5)
-            right_available = self.width - left_width - 10
-            right_width = right_available  # Plot takes full available space
-            # Align plot to the right edge
-            plot_x = self.width - right_width - 10
-            # Plot height is full available height
-            plot_height = self.height - self.data_start_y - 10
-
-            # Compute vertical spacing to fit all enabled channels in one column
-            available_height = self.height - self.data_start_y - 10
-            row_spacing = max(40, min(70, available_height // max(1, enabled_count)))
+            self._paste_text(image, (self.width - 150, 65), range_text, self.font_small)
 
             # Display readings in a single column on the left
-            linestyle_symbols = {0: '━', 1: '···', 2: '- -', 3: '-·-', 4: '--··'}
-            for display_idx, idx in enumerate(enabled_indices):
-                reading = readings[idx]
-                x_pos = 20
-                y_pos_current = self.data_start_y + display_idx * row_spacing
-
-                label = f"CH {idx + 1}:"
-                # Flash effect: invert label on alternating phases
-                if self.flash_ticks > 0 and self.flash_phase:
-                    label_bbox = draw.textbbox((x_pos, y_pos_current), label, font=font_medium)
-                    draw.rectangle(label_bbox, fill=0)
-                    draw.text((x_pos, y_pos_current), label, font=font_medium, fill=255)
-                else:
-                    draw.text((x_pos, y_pos_current), label, font=font_medium, fill=0)
-
-                # Compute label width to place the unplugged icon just to the right
-                label_bbox = draw.textbbox((x_pos, y_pos_current), label, font=font_medium)
-                label_width = label_bbox[2] - label_bbox[0]
-
-                # Add unplugged icon or line style indicator below channel label
-                if self.flash_ticks == 0:
-                    if (idx + 1) in self.unplugged_channels:
-                        if self.unplugged_icon:
-                            try:
-                                icon_w, icon_h = self.unplugged_icon.size
-                                icon_x = x_pos + label_width + 6  # small gap after text
-                                # Vertically center icon relative to label text
-                                label_height = label_bbox[3] - label_bbox[1]
-                                icon_y = y_pos_current + max(0, (label_height - icon_h) // 2)
-                                image.paste(self.unplugged_icon, (icon_x, icon_y))
-                            except Exception as e:
-                                print(f"[EPAPER] Error pasting icon: {e}")
-                    else:
-                        style_indicator = linestyle_symbols.get(display_idx % 5, '━')
-                        draw.text((x_pos, y_pos_current + 25), style_indicator, font=self.font_small, fill=0)
-
-                try:
-                    temp_val = float(reading)
-                    if not math.isnan(temp_val):
-                        value_text = f"{temp_val:.1f}"
-                        unit_text = "°C"
-                    else:
-                        value_text = "--"
-                        unit_text = "°C"
-                except (TypeError, ValueError):
-                    value_text = "--"
-                    unit_text = "°C"
-                
-                draw.text((x_pos + 150, y_pos_current), value_text, font=font_digital, fill=0)
-                draw.text((x_pos + 320, y_pos_current + 5), unit_text, font=font_unit, fill=0)
-                
-                if self.settings_manager:
-                    tc_type = self.settings_manager.get_channel_type(idx)
-                    draw.text((x_pos + 320, y_pos_current + 35), tc_type, font=font_tc, fill=0)
-
-            # Plot last hour on the right using matplotlib
+            for idx, label_mask, label_box, style_indicator, cell in rows:
+                x_value, y_pos_current = cell[1], cell[3]
+                self._paste_digits(image, (x_value, y_pos_current), values[idx][0], font_digital)
+
+            # Plot the configured time range on the right
             plot_result = self._draw_plot(draw, enabled_indices, plot_x, self.data_start_y, right_width, plot_height)
             if plot_result:
                 plot_img, px, py = plot_result
                 image.paste(plot_img, (px, py))
 
-            # Use full-screen partial refresh. Limiting to a sub-region caused
-            # stretched/zoomed visuals on hardware during flash cycles.
-            x, y, w, h = 0, 0, self.width, self.height
-
-            # Partial refresh the chosen region (partial mode was already activated in init_display)
-            self.epd.display_Partial(
-                self.epd.getbuffer(image),
-                x,
-                y,
-                w,
-                h
-            )
+            # Partial refresh only the window below the title (partial mode was
+            # already activated in init_display). The driver expects a buffer
+            # laid out with the window's own stride; passing the full-screen
+            # buffer with a smaller window is what caused stretched visuals.
+            window = self._refresh_window()
+            # The reusable window buffer may still be on the wire; pack into a fresh one then
+            buf = self._pack_window(image, *window, reuse=not self._refresh_busy())
+            self._submit_partial(buf, window)
 
             # Step flashing state
             if self.flash_ticks > 0:
                 self.flash_phase = not self.flash_phase
                 self.flash_ticks -= 1
             
+            self._last_image = image
             return image  # Return the image for preview
 
         except Exception as e:
-            logging.error(f"Error displaying on e-paper: {e}")
-            print(f"[EPAPER ERROR] {e}")
-            import traceback
-            traceback.print_exc()
+            self._last_draw_key = None
+            # A persistent fault would otherwise log a traceback on every tick
+            now = time.monotonic()
+            if now - self._last_error_log >= ERROR_LOG_INTERVAL:
+                suppressed = self._suppressed_errors
+                self._last_error_log = now
+                self._suppressed_errors = 0
+                logger.warning("Error displaying on e-paper: %s (%d similar errors suppressed)",
+                               e, suppressed, exc_info=True)
+            else:
+                self._suppressed_errors += 1
             return None
 
+    def _fast_getbuffer(self, image: Image.Image):
+        """Pack a 1-bit image into the EPD byte layout using NumPy.
+
+        PIL already stores "1" images packed 8 pixels per byte, MSB first, with
+        1 = white; the EPD wants 1 = black, so the frame is one bitwise NOT over
+        the raw bytes instead of the driver's per-pixel loop. Returns a
+        (height, width // 8) uint8 array that is reused between frames. The result is checked once against
+        getbuffer and the driver path is used permanently if the layouts differ.
+        """
+        if self._fast_buffer_ok is False:
+            return self.epd.getbuffer(image)
+
+        stride = self.width // 8
+        if self.width % 8 == 0:
+            if self._frame_np is None:
+                self._frame_np = np.empty((self.height, stride), dtype=np.uint8)
+            raw = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(self.height, stride)
+            packed = np.bitwise_not(raw, out=self._frame_np)
+        else:
+            ink = ~np.asarray(image, dtype=bool).reshape(self.height, self.width)
+            packed = np.packbits(ink, axis=1, bitorder="big")
+
+        if self._fast_buffer_ok is None:
+            reference = self.epd.getbuffer(image)
+            self._fast_buffer_ok = bytes(reference) == packed.tobytes()
+            if not self._fast_buffer_ok:
+                logger.warning("NumPy framebuffer packing differs from driver, using getbuffer")
+                return reference
+        return packed
+
+    def _submit_partial(self, buf: bytearray, window: Tuple[int, int, int, int]) -> None:
+        """Hand a packed window to the refresh worker, or queue it if the panel is busy."""
+        if not self._refresh_pool:
+            self._push_partial(buf, *window)
+            return
+        with self._pending_lock:
+            if self._refresh_active:
+                # Latest wins: replaces any frame still waiting behind the one in flight
+                self._pending_frame = (buf, window)
+                return
+            self._refresh_active = True
+        self._refresh_future = self._refresh_pool.submit(self._refresh_worker, buf, window)
+
+    def _refresh_worker(self, buf: bytearray, window: Tuple[int, int, int, int]) -> None:
+        """Push frames until no newer one is waiting (runs on the refresh thread)."""
+        while True:
+            self._push_partial(buf, *window)
+            with self._pending_lock:
+                frame = self._pending_frame
+                self._pending_frame = None
+                if frame is None:
+                    self._refresh_active = False
+                    return
+            buf, window = frame
+
+    def _push_partial(self, buf: bytearray, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Send the part of a packed window that differs from what the panel shows.
+
+        The window is diffed against the last one sent and only the bounding
+        box of the changed bytes goes out (nothing when it is identical).
+        Diffing here rather than at submit time keeps it correct when waiting
+        frames are replaced. display_Partial waits on BUSY itself.
+        """
+        window = (x0, y0, x1, y1)
+        try:
+            with self._epd_lock:
+                new = np.frombuffer(buf, dtype=np.uint8).reshape(y1 - y0, (x1 - x0) // 8)
+                sent = self._panel_window
+                if sent is not None and sent[0] == window:
+                    diff = new != sent[1]
+                    rows = np.flatnonzero(diff.any(axis=1))
+                    if not len(rows):
+                        return
+                    cols = np.flatnonzero(diff.any(axis=0))
+                    r0, r1 = int(rows[0]), int(rows[-1]) + 1
+                    c0, c1 = int(cols[0]), int(cols[-1]) + 1
+                    self.epd.display_Partial(bytearray(new[r0:r1, c0:c1].tobytes()),
+                                             x0 + c0 * 8, y0 + r0, x0 + c1 * 8, y0 + r1)
+                    np.copyto(sent[1][r0:r1, c0:c1], new[r0:r1, c0:c1])
+                else:
+                    self._panel_window = None
+                    self.epd.display_Partial(buf, x0, y0, x1, y1)
+                    self._panel_window = (window, new.copy())
+        except Exception as e:
+            logger.error("Partial refresh failed: %s", e)
+            self._panel_window = None
+            self._last_draw_key = None
+
+    def _refresh_busy(self) -> bool:
+        """True while the refresh worker is sending or has a frame waiting."""
+        with self._pending_lock:
+            return self._refresh_active
+
+    def _wait_for_refresh(self) -> None:
+        """Block until the in-flight partial refresh and any waiting frame have been sent."""
+        if self._refresh_future is not None:
+            self._refresh_future.result()
+            self._refresh_future = None
+
+    def _refresh_window(self) -> Tuple[int, int, int, int]:
+        """Return the (x0, y0, x1, y1) window that changes between updates.
+
+        Covers the status strip and the data/plot area; x is widened to whole
+        bytes because the EPD buffer packs 8 pixels per byte (MSB first).
+        """
+        x0 = (10 // 8) * 8
+        x1 = min(self.width, -(-(self.width - 10) // 8) * 8)
+        return x0, 60, x1, self.height
+
+    def _pack_window(self, image: Image.Image, x0: int, y0: int, x1: int, y1: int, reuse: bool = True) -> bytearray:
+        """Pack only the refresh window of the canvas into the EPD byte layout.
+
+        The byte-aligned window is cropped out of the 1-bit canvas and its raw
+        bytes are inverted straight into the window buffer, so the rest of the
+        frame is never packed. Until the NumPy layout has been checked against
+        getbuffer, the full-frame path is used.
+        """
+        if self._fast_buffer_ok is not True or self.width % 8:
+            return self._crop_buffer(self._fast_getbuffer(image), x0, y0, x1, y1, reuse=reuse)
+        out = self._window_out((y1 - y0) * ((x1 - x0) // 8), reuse)
+        raw = np.frombuffer(image.crop((x0, y0, x1, y1)).tobytes(), dtype=np.uint8)
+        np.bitwise_not(raw, out=np.frombuffer(out, dtype=np.uint8))
+        return out
+
+    def _window_out(self, size: int, reuse: bool) -> bytearray:
+        """Return the reusable window buffer, or a new one when it cannot be reused."""
+        out = self._window_buf if reuse else None
+        if out is None or len(out) != size:
+            out = bytearray(size)
+            if reuse:
+                self._window_buf = out
+        return out
+
+    def _crop_buffer(self, buf, x0: int, y0: int, x1: int, y1: int, reuse: bool = True) -> bytearray:
+        """Extract the packed bytes for a byte-aligned window from a full-screen buffer.
+
+        NumPy frames are copied into a window buffer that is reused between
+        frames, or into a new one when reuse is False.
+        """
+        stride = self.width // 8
+        bx0 = x0 // 8
+        bx1 = x1 // 8
+        if isinstance(buf, np.ndarray):
+            rows, cols = y1 - y0, bx1 - bx0
+            out = self._window_out(rows * cols, reuse)
+            np.copyto(np.frombuffer(out, dtype=np.uint8).reshape(rows, cols),
+                      buf.reshape(-1, stride)[y0:y1, bx0:bx1])
+            return out
+        if bx0 == 0 and bx1 == stride:
+            return bytearray(buf[y0 * stride:y1 * stride])
+        region = bytearray()
+        for row in range(y0, y1):
+            start = row * stride
+            region += buf[start + bx0:start + bx1]
+        return region
+
     def clear(self) -> None:
         """Clear the e-paper display."""
         if self.available and self.epd:
             try:
-                self.epd.init()
-                self.epd.Clear()
+                self._wait_for_refresh()
+                with self._epd_lock:
+                    self.epd.init()
+                    self._apply_spi_speed()
+                    self.epd.Clear()
+                    self._panel_window = None
                 self.initialized = False
                 self.partial_mode_active = False
+                self._base_bytes = None
+                self._last_draw_key = None
             except Exception as e:
-                logging.error(f"Error clearing e-paper: {e}")
+                logger.error("Error clearing e-paper: %s", e)
 
     def sleep(self) -> None:
         """Put e-paper display into sleep mode."""
         if self.available and self.epd:
             try:
-                self.epd.sleep()
+                self._wait_for_refresh()
+                with self._epd_lock:
+                    self.epd.sleep()
+                    self._panel_window = None
             except Exception as e:
-                logging.error(f"Error putting e-paper to sleep: {e}")
+                logger.error("Error putting e-paper to sleep: %s", e)
 
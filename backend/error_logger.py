@@ -1,11 +1,134 @@
 """Comprehensive error and event logging for ThermoLogger."""
 
 import logging
+import os
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 
+# Bytes below maxBytes from which FastRotatingFileHandler checks the real file size
+ROLLOVER_MARGIN = 16 * 1024
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats asctime once per second instead of once per record.
+
+    The cache is one (second, datefmt, text) tuple, replaced in a single
+    assignment, so threads formatting concurrently at worst both format.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None or "%f" in datefmt:
+            # Default format adds milliseconds per record
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_fmt, text = self._time_cache
+        if second != cached_second or datefmt != cached_fmt:
+            text = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, datefmt, text)
+        return text
+
+
+class _FormatOutsideLockMixin:
+    """Format records before taking the handler lock; only the write is serialized.
+
+    Handler.handle holds the lock around emit, i.e. around formatting as well
+    as I/O, so the reader thread and the GUI thread wait on each other's
+    formatting. Subclasses implement _write_formatted(record, msg), which is
+    called with the lock held.
+    """
+
+    def handle(self, record):
+        rv = self.filter(record)
+        if rv:
+            if isinstance(rv, logging.LogRecord):  # Python 3.12+ filters may return a record
+                record = rv
+            try:
+                msg = self.format(record)
+            except Exception:
+                self.handleError(record)
+                return rv
+            with self.lock:
+                self._write_formatted(record, msg)
+        return rv
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._write_formatted(record, msg)
+
+
+class FastStreamHandler(_FormatOutsideLockMixin, logging.StreamHandler):
+    """StreamHandler that formats outside its lock."""
+
+    def _write_formatted(self, record, msg):
+        try:
+            self.stream.write(msg + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FastRotatingFileHandler(_FormatOutsideLockMixin, RotatingFileHandler):
+    """RotatingFileHandler that keeps a running file size instead of checking the file per record.
+
+    The stock shouldRollover calls os.path.exists and os.path.isfile, seeks to
+    the end and formats the record a second time on every emit. This handler
+    counts the bytes of each record it writes, and only does the exact check
+    once the count is within ROLLOVER_MARGIN of maxBytes.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        # Never roll over anything but a regular file (bpo-45401), checked once
+        self._regular = not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+        self._size = None  # Bytes in the current file; None = read it from the stream
+
+    def _write_formatted(self, record, msg):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg + self.terminator)
+            self.flush()
+            if self._size is not None:
+                self._size += len(msg if msg.isascii() else msg.encode(self.encoding or "utf-8")) + len(self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0 or not self._regular:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+            self._size = None
+        if self._size is None:
+            self._size = self.stream.seek(0, 2)
+        if self._size < self.maxBytes - ROLLOVER_MARGIN:
+            return False
+        # Close to the limit: use the exact check, then resync the count
+        rollover = super().shouldRollover(record)
+        self._size = None
+        return rollover
+
+    def doRollover(self):
+        super().doRollover()
+        self._size = None
+
 
 class ErrorLogger:
     """Centralized error logging system for the entire application."""
@@ -46,15 +169,15 @@ class ErrorLogger:
         logger.handlers.clear()
 
         # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
+        formatter = CachedTimeFormatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
 
         # File handler with rotation
         log_file = self.log_dir / "thermologger.log"
         try:
-            file_handler = RotatingFileHandler(
+            file_handler = FastRotatingFileHandler(
                 str(log_file),
                 maxBytes=self.max_bytes,
                 backupCount=5
@@ -66,7 +189,7 @@ class ErrorLogger:
             print(f"Warning: Could not create file handler for logging: {e}", file=sys.stderr)
 
         # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = FastStreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
@@ -77,14 +200,17 @@ class ErrorLogger:
     @classmethod
     def get_logger(cls) -> logging.Logger:
         """Get the logger instance."""
-        if cls._logger is None:
-            # Create singleton instance to initialize logging
-            try:
-                instance = cls()
-            except Exception as e:
-                print(f"FATAL: Could not initialize ErrorLogger: {e}", file=sys.stderr)
-                # Return a minimal fallback logger
-                return logging.getLogger("ThermoLogger_Fallback")
+        logger = cls._logger
+        if logger is not None:
+            return logger
+
+        # Create singleton instance to initialize logging
+        try:
+            instance = cls()
+        except Exception as e:
+            print(f"FATAL: Could not initialize ErrorLogger: {e}", file=sys.stderr)
+            # Return a minimal fallback logger
+            return logging.getLogger("ThermoLogger_Fallback")
         
         if cls._logger is None:
             print(f"FATAL: Logger still None after initialization", file=sys.stderr)
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import json
-import logging
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from backend.error_logger import ErrorLogger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class SettingsManager:
     """Manages application settings including thermocouple types."""
@@ -18,48 +24,38 @@ class SettingsManager:
 
     def __init__(self, settings_file: str | Path = "settings.json"):
         self.settings_file = Path(settings_file)
-        self.channel_types: List[str] = [self.DEFAULT_TYPE] * 8
-        self.channel_enabled: List[bool] = [True] * 8  # All channels enabled by default
+        # Channel config packed as one type letter per byte and one enabled bit per channel
+        self._types_buf = bytearray(self.DEFAULT_TYPE.encode() * 8)
+        self._enabled_mask: int = 0xFF  # All channels enabled by default
         self.show_preview: bool = True  # Show e-paper preview by default
+        self.plot_interval: float = 10.0  # Seconds between e-paper plot re-renders
+        self.epd_spi_hz: int = 0  # E-paper SPI clock in Hz; 0 keeps the driver default
+        self.revision: int = 0  # Bumped on every channel config change so consumers can cache
+        self._enabled_cache: Tuple[int, ...] = ()
+        self._enabled_revision: Optional[int] = None
         self.load_settings()
 
     def load_settings(self) -> bool:
         """Load settings from JSON file."""
         if not self.settings_file.exists():
-            msg = f"Settings file not found at {self.settings_file}, using defaults"
-            logging.info(msg)
-            ErrorLogger.log_info(f"[SETTINGS] {msg}")
-            print(f"[SETTINGS] No settings file found, using defaults")
+            ErrorLogger.log_info(f"[SETTINGS] Settings file not found at {self.settings_file}, using defaults")
             return False
 
         try:
-            with open(self.settings_file, 'r') as f:
-                data = json.load(f)
-                self.channel_types = data.get('channel_types', [self.DEFAULT_TYPE] * 8)
-                self.channel_enabled = data.get('channel_enabled', [True] * 8)
-                self.show_preview = data.get('show_preview', True)
-                
-                # Ensure we have exactly 8 channels
-                while len(self.channel_types) < 8:
-                    self.channel_types.append(self.DEFAULT_TYPE)
-                self.channel_types = self.channel_types[:8]
-                
-                while len(self.channel_enabled) < 8:
-                    self.channel_enabled.append(True)
-                self.channel_enabled = self.channel_enabled[:8]
-                
-                msg = f"Settings loaded from {self.settings_file}"
-                logging.info(msg)
-                ErrorLogger.log_info(f"[SETTINGS] {msg}")
-                print(f"[SETTINGS] Loaded from {self.settings_file}")
-                print(f"[SETTINGS] Channel types: {self.channel_types}")
-                print(f"[SETTINGS] Channel enabled: {self.channel_enabled}")
-                return True
+            raw = self.settings_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            # The setters pad or truncate to exactly 8 channels
+            self.channel_types = data.get('channel_types', [self.DEFAULT_TYPE] * 8)
+            self.channel_enabled = data.get('channel_enabled', [True] * 8)
+            self.show_preview = data.get('show_preview', True)
+            self.plot_interval = float(data.get('plot_interval', 10.0))
+            self.epd_spi_hz = int(data.get('epd_spi_hz', 0) or 0)
+            
+            ErrorLogger.log_info(f"[SETTINGS] Settings loaded from {self.settings_file} "
+                                 f"(types: {self.channel_types}, enabled: {self.channel_enabled})")
+            return True
         except Exception as e:
-            error_msg = f"Error loading settings: {e}"
-            logging.error(error_msg)
-            ErrorLogger.log_error(f"[SETTINGS] {error_msg}", e)
-            print(f"[SETTINGS ERROR] Failed to load: {e}")
+            ErrorLogger.log_error(f"[SETTINGS] Error loading settings: {e}", e)
             return False
 
     def save_settings(self) -> bool:
@@ -68,57 +64,99 @@ class SettingsManager:
             data = {
                 'channel_types': self.channel_types,
                 'channel_enabled': self.channel_enabled,
-                'show_preview': self.show_preview
+                'show_preview': self.show_preview,
+                'plot_interval': self.plot_interval,
+                'epd_spi_hz': self.epd_spi_hz
             }
-            with open(self.settings_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            msg = f"Settings saved to {self.settings_file}"
-            logging.info(msg)
-            ErrorLogger.log_info(f"[SETTINGS] {msg}")
-            print(f"[SETTINGS] Saved to {self.settings_file}")
-            print(f"[SETTINGS] Channel types: {self.channel_types}")
-            print(f"[SETTINGS] Channel enabled: {self.channel_enabled}")
+            if HAS_ORJSON:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode()
+            # Write a temporary file and swap it in, so a crash never leaves half-written settings
+            tmp_file = self.settings_file.with_name(self.settings_file.name + ".tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.settings_file)
+            ErrorLogger.log_info(f"[SETTINGS] Settings saved to {self.settings_file} "
+                                 f"(types: {self.channel_types}, enabled: {self.channel_enabled})")
             return True
         except Exception as e:
-            error_msg = f"Error saving settings: {e}"
-            logging.error(error_msg)
-            ErrorLogger.log_error(f"[SETTINGS] {error_msg}", e)
-            print(f"[SETTINGS ERROR] Failed to save: {e}")
+            ErrorLogger.log_error(f"[SETTINGS] Error saving settings: {e}", e)
             return False
 
+    @property
+    def channel_types(self) -> List[str]:
+        """Thermocouple type letter of every channel, as a new list."""
+        return list(self._types_buf.decode())
+
+    @channel_types.setter
+    def channel_types(self, types: List[str]) -> None:
+        types = [t if t in self.THERMOCOUPLE_TYPES else self.DEFAULT_TYPE for t in list(types)[:8]]
+        types += [self.DEFAULT_TYPE] * (8 - len(types))
+        self._types_buf = bytearray("".join(types).encode())
+        self.revision += 1
+
+    @property
+    def channel_enabled(self) -> List[bool]:
+        """Enabled flag of every channel, as a new list."""
+        return [bool(self._enabled_mask >> i & 1) for i in range(8)]
+
+    @channel_enabled.setter
+    def channel_enabled(self, enabled: List[bool]) -> None:
+        enabled = list(enabled)[:8]
+        enabled += [True] * (8 - len(enabled))
+        self._enabled_mask = sum(1 << i for i, on in enumerate(enabled) if on)
+        self.revision += 1
+
     def get_channel_type(self, channel: int) -> str:
         """Get thermocouple type for a specific channel (0-7)."""
         if 0 <= channel < 8:
-            return self.channel_types[channel]
+            return chr(self._types_buf[channel])
         return self.DEFAULT_TYPE
 
     def set_channel_type(self, channel: int, tc_type: str) -> bool:
         """Set thermocouple type for a specific channel (0-7)."""
         if 0 <= channel < 8 and tc_type in self.THERMOCOUPLE_TYPES:
-            self.channel_types[channel] = tc_type
+            self._types_buf[channel] = ord(tc_type)
+            self.revision += 1
             return True
         return False
 
     def get_all_channel_types(self) -> List[str]:
         """Get all channel thermocouple types."""
-        return self.channel_types.copy()
+        return self.channel_types
 
     def is_channel_enabled(self, channel: int) -> bool:
         """Check if a channel is enabled (0-7)."""
         if 0 <= channel < 8:
-            return self.channel_enabled[channel]
+            return bool(self._enabled_mask >> channel & 1)
         return False
 
     def set_channel_enabled(self, channel: int, enabled: bool) -> bool:
         """Enable or disable a channel (0-7)."""
         if 0 <= channel < 8:
-            self.channel_enabled[channel] = enabled
+            if enabled:
+                self._enabled_mask |= 1 << channel
+            else:
+                self._enabled_mask &= ~(1 << channel)
+            self.revision += 1
             return True
         return False
 
+    def get_enabled_mask(self) -> int:
+        """Get the enabled channels as a bitmask (bit 0 = channel 0)."""
+        return self._enabled_mask
+
     def get_enabled_channels(self) -> List[int]:
         """Get list of enabled channel numbers (0-7)."""
-        return [i for i in range(8) if self.channel_enabled[i]]
+        return list(self.get_enabled_channels_array())
+
+    def get_enabled_channels_array(self) -> Tuple[int, ...]:
+        """Get enabled channel numbers (0-7) as a tuple, cached until the channel config changes."""
+        if self._enabled_revision != self.revision:
+            mask = self._enabled_mask
+            self._enabled_cache = tuple(i for i in range(8) if mask >> i & 1)
+            self._enabled_revision = self.revision
+        return self._enabled_cache
 
     def set_all_channel_types(self, types: List[str]) -> bool:
         """Set all channel thermocouple types."""
@@ -126,5 +164,5 @@ class SettingsManager:
             return False
         if not all(t in self.THERMOCOUPLE_TYPES for t in types):
             return False
-        self.channel_types = types.copy()
+        self.channel_types = types
         return True
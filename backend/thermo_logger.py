@@ -2,25 +2,61 @@
 
 from __future__ import annotations
 
-import csv
-import logging
+import os
+import time
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
 
 from backend.error_logger import ErrorLogger
 
+# Seconds buffered rows may wait before they are flushed to disk
+FLUSH_INTERVAL = 30.0
+# Row terminator written by csv.writer, kept so appended files stay consistent
+ROW_END = "\r\n"
+# CSV size at which the file is moved aside and a new one is started
+MAX_BYTES = 100 * 1024 * 1024
+
+
+def _format_field(value) -> str:
+    """Format one CSV field the way csv.writer does for numbers and None."""
+    return "" if value is None else str(value)
+
+
+def _make_picker(indices):
+    """Return a function selecting the given reading indices as a tuple."""
+    if not indices:
+        return lambda readings: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda readings: (readings[index],)
+    return itemgetter(*indices)
+
 
 class ThermoLogger:
     """Handles CSV logging of temperature readings."""
 
-    def __init__(self, data_dir: str | Path = "Data", settings_manager=None):
+    def __init__(self, data_dir: str | Path = "Data", settings_manager=None,
+                 buffer_size: int = 65536, flush_interval: float = FLUSH_INTERVAL,
+                 max_bytes: int = MAX_BYTES):
         self.data_dir = Path(data_dir)
         self.settings_manager = settings_manager
         self.csv_file = None
-        self.csv_writer = None
+        self.file_handle = None  # Buffered binary handle; rows are flushed every flush_interval
         self.is_logging = False
         self.channels = 8
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes  # 0 disables size rollover
+        self._written_bytes = 0  # Size of the current file, counted as rows are written
+        self._rollover_failed = False  # Set when the full file could not be moved; cleared per session
+        self._header: List[str] = []
+        self._last_flush = 0.0  # time.monotonic() of the last flush
+        self._picker_key = None  # (enabled indices, reading count) the picker was built for
+        self._picker = None
+        self._ts_minute = None  # Epoch minute the cached timestamp prefix belongs to
+        self._ts_prefix = ""
 
         # Create Data directory if it doesn't exist
         self.data_dir.mkdir(exist_ok=True)
@@ -28,23 +64,19 @@ class ThermoLogger:
     def start_logging(self) -> bool:
         """Start logging with a new CSV file for the current date."""
         if self.is_logging:
-            msg = "Logging already active"
-            logging.warning(msg)
-            ErrorLogger.log_warning(msg)
+            ErrorLogger.log_warning("[LOGGING] Logging already active")
             return False
 
         try:
             # Create filename based on current date
             today = datetime.now().strftime("%Y-%m-%d")
             self.csv_file = self.data_dir / f"temperatures_{today}.csv"
+            self._rollover_failed = False
 
-            # Check if file already exists to determine if we need to write header
-            file_exists = self.csv_file.exists()
+            # One open both creates and appends; an empty file (new or not) gets the header
+            self._open_file()
+            file_exists = self._written_bytes > 0
 
-            # Open file in append mode
-            self.csv_file.open("a", newline="").close()  # Ensure file exists
-            self.file_handle = open(str(self.csv_file), "a", newline="")
-            
             # Prepare CSV header - only include enabled channels
             header = ["Timestamp"]
             if self.settings_manager:
@@ -54,59 +86,129 @@ class ThermoLogger:
             else:
                 header += [f"CH{i+1}" for i in range(self.channels)]
 
+            self._header = header
+
             # Only write header if file is new
             if not file_exists:
-                self.csv_writer = csv.writer(self.file_handle)
-                self.csv_writer.writerow(header)
-                msg = f"Created new log file: {self.csv_file}"
-                print(f"[LOGGING] {msg}")
-                logging.info(msg)
-                ErrorLogger.log_info(f"[LOGGING] {msg}")
+                self._write_row(header)
+                ErrorLogger.log_info(f"[LOGGING] Created new log file: {self.csv_file}")
             else:
-                self.csv_writer = csv.writer(self.file_handle)
-                msg = f"Appending to existing log file: {self.csv_file}"
-                print(f"[LOGGING] {msg}")
-                logging.info(msg)
-                ErrorLogger.log_info(f"[LOGGING] {msg}")
+                ErrorLogger.log_info(f"[LOGGING] Appending to existing log file: {self.csv_file}")
 
             self.is_logging = True
-            msg = f"Started logging to {self.csv_file}"
-            print(f"[LOGGING] {msg}")
-            logging.info(msg)
-            ErrorLogger.log_info(f"[LOGGING] {msg}")
+            ErrorLogger.log_info(f"[LOGGING] Started logging to {self.csv_file}")
             return True
 
         except Exception as e:
-            error_msg = f"Error starting logging: {e}"
-            print(f"[LOGGING ERROR] {error_msg}")
-            logging.error(error_msg)
-            ErrorLogger.log_error(f"[LOGGING] {error_msg}", e)
+            ErrorLogger.log_error(f"[LOGGING] Error starting logging: {e}", e)
             self.is_logging = False
             return False
 
-    def log_reading(self, readings: List[float]) -> None:
-        """Log a temperature reading to CSV - only enabled channels."""
-        if not self.is_logging or not self.csv_writer:
+    def log_reading(self, readings: List[float], timestamp_ns: Optional[int] = None) -> None:
+        """Log a temperature reading to CSV - only enabled channels.
+
+        Rows are buffered and flushed once flush_interval has passed since the
+        last flush, so with logging intervals of that length or longer every
+        row is still written straight away. timestamp_ns (time.time_ns())
+        defaults to now.
+        """
+        if not self.is_logging or not self.file_handle:
             return
 
         try:
-            timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-            row = [timestamp]
-            
+            if timestamp_ns is None:
+                timestamp_ns = time.time_ns()
+            timestamp = self._format_timestamp(timestamp_ns // 1_000_000_000)
             # Only log enabled channels
-            if self.settings_manager:
-                for i, temp in enumerate(readings):
-                    if self.settings_manager.is_channel_enabled(i):
-                        row.append(temp)
+            values = self._pick_enabled(readings)
+            if values and None not in values:
+                line = timestamp + "," + ",".join(map(str, values)) + ROW_END
             else:
-                row += readings
-                
-            self.csv_writer.writerow(row)
-            self.file_handle.flush()  # Flush to ensure data is written
+                line = ",".join([timestamp] + [_format_field(v) for v in values]) + ROW_END
+            self._write_line(line)
+            if self.max_bytes and self._written_bytes >= self.max_bytes and not self._rollover_failed:
+                self._rollover()
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self.file_handle.flush()
+                self._last_flush = now
         except Exception as e:
-            error_msg = f"Error logging reading: {e}"
-            logging.error(error_msg)
-            ErrorLogger.log_error(f"[LOGGING] {error_msg}", e)
+            ErrorLogger.log_error(f"[LOGGING] Error logging reading: {e}", e)
+
+    def _format_timestamp(self, seconds: int) -> str:
+        """Return epoch seconds as local "%d-%m-%Y %H:%M:%S", running strftime once per minute."""
+        minute, second = divmod(seconds, 60)
+        if minute != self._ts_minute:
+            self._ts_prefix = datetime.fromtimestamp(minute * 60).strftime("%d-%m-%Y %H:%M:")
+            self._ts_minute = minute
+        return f"{self._ts_prefix}{second:02d}"
+
+    def _pick_enabled(self, readings):
+        """Return the readings of the enabled channels, rebuilding the picker only when they change."""
+        indices = self.settings_manager.get_enabled_channels_array() if self.settings_manager else None
+        key = (indices, len(readings))
+        if key != self._picker_key:
+            if indices is None:
+                indices = range(len(readings))
+            self._picker = _make_picker([i for i in indices if i < len(readings)])
+            self._picker_key = key
+        return self._picker(readings)
+
+    def _write_row(self, row) -> None:
+        """Append one comma-separated row to the buffered file."""
+        self._write_line(",".join([_format_field(v) for v in row]) + ROW_END)
+
+    def _write_line(self, line: str) -> None:
+        """Append one terminated line, keeping count of the file size."""
+        data = line.encode()
+        self.file_handle.write(data)
+        self._written_bytes += len(data)
+
+    def _open_file(self) -> None:
+        """Open csv_file for appending; rows collect in the buffer between flushes."""
+        self.file_handle = open(str(self.csv_file), "ab", buffering=self.buffer_size)
+        self._written_bytes = self.file_handle.tell()  # Append mode starts at the end
+        self._last_flush = time.monotonic()
+
+    def _rollover(self) -> None:
+        """Move the full file aside as temperatures_<date>.<N>.csv and continue in a new one."""
+        self.file_handle.close()
+        self.file_handle = None
+        n = 1
+        while True:
+            target = self.csv_file.with_name(f"{self.csv_file.stem}.{n}{self.csv_file.suffix}")
+            if not target.exists():
+                break
+            n += 1
+        try:
+            os.rename(self.csv_file, target)
+        except OSError as e:
+            # Keep appending to the same file rather than stopping the log, and don't
+            # retry for the rest of this session
+            self._rollover_failed = True
+            ErrorLogger.log_error(f"[LOGGING] Could not move full log file to {target}, "
+                                  f"continuing without size rollover: {e}", e)
+            self._reopen_after_rollover()
+            return
+        ErrorLogger.log_info(f"[LOGGING] Log file reached {self.max_bytes} bytes, moved to {target}")
+        if self._reopen_after_rollover():
+            self._write_row(self._header)
+
+    def _reopen_after_rollover(self) -> bool:
+        """Reopen csv_file after a rollover; stop logging if that fails."""
+        try:
+            self._open_file()
+            return True
+        except OSError as e:
+            self.is_logging = False
+            ErrorLogger.log_error(f"[LOGGING] Could not reopen log file {self.csv_file}, logging stopped: {e}", e)
+            return False
+
+    def flush(self) -> None:
+        """Write buffered rows to disk now."""
+        if self.file_handle:
+            self.file_handle.flush()
+            self._last_flush = time.monotonic()
 
     def stop_logging(self) -> None:
         """Stop logging and close the CSV file."""
@@ -115,15 +217,12 @@ class ThermoLogger:
 
         try:
             if self.file_handle:
-                self.file_handle.close()
+                self.file_handle.close()  # Flushes any buffered rows
+                self.file_handle = None
             self.is_logging = False
-            msg = "Stopped logging"
-            logging.info(msg)
-            ErrorLogger.log_info(f"[LOGGING] {msg}")
+            ErrorLogger.log_info("[LOGGING] Stopped logging")
         except Exception as e:
-            error_msg = f"Error stopping logging: {e}"
-            logging.error(error_msg)
-            ErrorLogger.log_error(f"[LOGGING] {error_msg}", e)
+            ErrorLogger.log_error(f"[LOGGING] Error stopping logging: {e}", e)
 
     def get_log_file_path(self) -> Optional[Path]:
         """Return the current log file path."""
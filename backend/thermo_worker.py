@@ -5,15 +5,62 @@ import random
 import time
 from typing import List
 
-from PyQt5.QtCore import QThread, pyqtSignal
+import numpy as np
+from PyQt5.QtCore import QThread, QTimer, Qt, pyqtSignal
 
 from backend.error_logger import ErrorLogger
 
-try:
-    from perlin_noise import PerlinNoise
-    HAS_PERLIN = True
-except ImportError:
-    HAS_PERLIN = False
+# Ken Perlin's reference permutation; indexes are wrapped to 8 bits
+_PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+], dtype=np.uint8)
+# 1-D gradient per permutation entry: +-1/8 .. +-8/8 from the low four hash bits
+_GRAD = np.where(_PERM & 8, -1.0, 1.0) * ((_PERM & 7) + 1) / 8.0
+# Lattice offset between channels, so each channel follows its own noise curve
+_CHANNEL_SEED_STEP = 37
+
+
+def _perlin1d(x: np.ndarray, seed: np.ndarray) -> np.ndarray:
+    """Vectorized 1-D gradient noise in [-0.5, 0.5], one value per element of x and seed."""
+    xi = np.floor(x)
+    xf = x - xi
+    cell = xi.astype(np.int64) + seed
+    g0 = _GRAD[_PERM[cell & 255]]
+    g1 = _GRAD[_PERM[(cell + 1) & 255]]
+    u = xf * xf * xf * (xf * (xf * 6.0 - 15.0) + 10.0)  # Quintic fade
+    return g0 * xf + u * (g1 * (xf - 1.0) - g0 * xf)
+
+
+def _mask_channels(mask: int) -> List[int]:
+    """Return the 1-based channels whose bits are set in mask (bit 0 = channel 1), ascending."""
+    channels = []
+    while mask:
+        low = mask & -mask
+        channels.append(low.bit_length())
+        mask ^= low
+    return channels
+
+
+# Settings type letter -> sm_tc type code (_TC_TYPE_B .. _TC_TYPE_T)
+_TC_TYPE_MAP = {'B': 0, 'E': 1, 'J': 2, 'K': 3, 'N': 4, 'R': 5, 'S': 6, 'T': 7}
+
+# Minimum seconds between reports of the same reading error (channel and exception type)
+ERROR_THROTTLE_SEC = 1.0
 
 
 class DummySMtc:
@@ -22,34 +69,29 @@ class DummySMtc:
     def __init__(self, channels: int = 8):
         self.channels = channels
         self.time_scale = 0.001  # Very slow time scale for extremely smooth variation
-        if HAS_PERLIN:
-            # Create independent Perlin noise generators for each channel with more octaves for smoothness
-            self.noise_generators = [PerlinNoise(octaves=1, seed=ch) for ch in range(channels)]
-        else:
-            self.noise_generators = None
+        self._bases = 20.0 + 2.0 * np.arange(channels)  # Slight offset per channel
+        self._seeds = _CHANNEL_SEED_STEP * np.arange(channels)  # Independent noise per channel
+
+    def get_all_temps(self) -> List[float]:
+        """Return temperatures for all channels (index 0 = channel 1) from one evaluation."""
+        # One clock read per batch; monotonic so an NTP step at boot cannot jump the curves
+        x = np.full(self.channels, time.monotonic() * self.time_scale)
+        temps = self._bases + 10.0 * _perlin1d(x, self._seeds)
+        return np.round(temps, 1).tolist()
 
     def get_temp(self, channel: int) -> float:
         """Return a realistic temperature value using Perlin noise."""
         if channel < 1 or channel > self.channels:
             return float("nan")
-        
-        ch_idx = channel - 1
-        base_temp = 20.0 + ch_idx * 2.0  # Slight offset per channel
-        
-        if HAS_PERLIN and self.noise_generators:
-            # Use Perlin noise for smooth, realistic variations
-            noise_val = self.noise_generators[ch_idx](time.time() * self.time_scale)
-            temp = base_temp + 10.0 * noise_val
-        else:
-            # Fallback to very smooth sine wave if perlin_noise not installed
-            phase = ch_idx * 0.6
-            temp = base_temp + 2.5 * math.sin(time.time() / 15.0 + phase)
-        
-        return round(temp, 1)
+        return self.get_all_temps()[channel - 1]
     
     def get_mv(self, channel: int) -> float:
         """Return a dummy voltage value (not used in dummy mode)."""
         return 0.0
+
+    def get_all_mv(self) -> List[float]:
+        """Return dummy voltages for all channels (not used in dummy mode)."""
+        return [0.0] * self.channels
     
     def check_unplugged_channels(self) -> List[int]:
         """Check for unplugged channels (returns empty list for dummy mode)."""
@@ -74,9 +116,13 @@ class ThermoThread(QThread):
         self._startup_error = ""
         self.device = None
         self.source = "unknown"
-        self.unplugged_channels = []  # List of channels with 0.00 mV (unplugged)
+        self._unplugged_mask = 0  # Channels with 0.00 mV (unplugged), bit 0 = channel 1
         self._check_counter = 0  # Counter for periodic unplugged checks
         self._check_interval = 10  # Check every 10 readings (~10 seconds)
+        self._active_key = None  # (enabled channels, unplugged mask) _active was built for
+        self._active: List[int] = []
+        self._error_times = {}  # (channel, exception type) -> time.monotonic() of the last report
+        self._error_suppressed = {}  # (channel, exception type) -> reports skipped since then
         self._init_device()
 
     def _init_device(self) -> None:
@@ -90,22 +136,10 @@ class ThermoThread(QThread):
             
             # Configure thermocouple types from settings if available
             if self.settings_manager:
-                # Mapping from settings letter to sm_tc constants
-                tc_type_map = {
-                    'B': 0,  # _TC_TYPE_B
-                    'E': 1,  # _TC_TYPE_E
-                    'J': 2,  # _TC_TYPE_J
-                    'K': 3,  # _TC_TYPE_K
-                    'N': 4,  # _TC_TYPE_N
-                    'R': 5,  # _TC_TYPE_R
-                    'S': 6,  # _TC_TYPE_S
-                    'T': 7   # _TC_TYPE_T
-                }
-                
                 for channel in range(self.channels):
                     tc_type_letter = self.settings_manager.get_channel_type(channel)
-                    if tc_type_letter in tc_type_map:
-                        tc_type_code = tc_type_map[tc_type_letter]
+                    tc_type_code = _TC_TYPE_MAP.get(tc_type_letter)
+                    if tc_type_code is not None:
                         try:
                             self.device.set_sensor_type(channel + 1, tc_type_code)
                             ErrorLogger.log_info(f"Set CH{channel + 1} to Type {tc_type_letter}")
@@ -114,25 +148,20 @@ class ThermoThread(QThread):
             
             # Check for unplugged channels (0.00 mV voltage)
             ErrorLogger.log_info("Checking for unplugged channels...")
-            self.unplugged_channels = []
-            for ch in range(1, self.channels + 1):
-                try:
-                    mv = self.device.get_mv(ch)
-                    if mv == 0.0:
-                        self.unplugged_channels.append(ch)
-                        ErrorLogger.log_hardware_event(ch, "unplugged", "0.00 mV")
-                except Exception as e:
-                    ErrorLogger.log_error(f"Error checking CH{ch} voltage", e)
+            self._unplugged_mask = self._read_unplugged()
+            unplugged = self.unplugged_channels
+            for ch in unplugged:
+                ErrorLogger.log_hardware_event(ch, "unplugged", "0.00 mV")
             
-            if self.unplugged_channels:
-                unplugged_str = ", ".join([f"CH{ch}" for ch in self.unplugged_channels])
+            if unplugged:
+                unplugged_str = ", ".join([f"CH{ch}" for ch in unplugged])
                 ErrorLogger.log_info(f"Unplugged channels detected: {unplugged_str}")
             
         except Exception as exc:  # pragma: no cover - depends on hardware
             self.device = DummySMtc(self.channels)
             self.source = "dummy"
             self._startup_error = str(exc)
-            ErrorLogger.log_warning(f"Hardware initialization failed, falling back to dummy mode: {exc}", exc)
+            ErrorLogger.log_warning(f"Hardware initialization failed, falling back to dummy mode: {exc}")
 
     def _check_unplugged_status(self) -> None:
         """Check voltage on all channels and update unplugged list if changed."""
@@ -140,39 +169,54 @@ class ThermoThread(QThread):
             return
         
         try:
-            current_unplugged = []
-            for ch in range(1, self.channels + 1):
-                try:
-                    mv = self.device.get_mv(ch)
-                    if mv == 0.0:
-                        current_unplugged.append(ch)
-                except Exception as e:
-                    ErrorLogger.log_error(f"Error checking voltage on CH{ch}", e)
+            current = self._read_unplugged()
+            previous = self._unplugged_mask
             
-            # Check if the unplugged list changed
-            if set(current_unplugged) != set(self.unplugged_channels):
-                # Find newly connected channels
-                newly_connected = set(self.unplugged_channels) - set(current_unplugged)
-                # Find newly disconnected channels
-                newly_disconnected = set(current_unplugged) - set(self.unplugged_channels)
+            # Check if the unplugged channels changed
+            if current != previous:
+                # One event per channel that was plugged in or pulled out since the last check
+                for ch in _mask_channels(previous & ~current):
+                    ErrorLogger.log_hardware_event(ch, "connected")
+                for ch in _mask_channels(current & ~previous):
+                    ErrorLogger.log_hardware_event(ch, "disconnected")
                 
-                if newly_connected:
-                    connected_str = ", ".join([f"CH{ch}" for ch in sorted(newly_connected)])
-                    ErrorLogger.log_hardware_event(list(newly_connected)[0], "connected", connected_str)
-                
-                if newly_disconnected:
-                    disconnected_str = ", ".join([f"CH{ch}" for ch in sorted(newly_disconnected)])
-                    ErrorLogger.log_hardware_event(list(newly_disconnected)[0], "disconnected", disconnected_str)
-                
-                # Update the list and emit signal
-                self.unplugged_channels = current_unplugged
-                self.unplugged_changed.emit(self.unplugged_channels)
+                # Update the mask and emit signal (as a sorted list)
+                self._unplugged_mask = current
+                self.unplugged_changed.emit(_mask_channels(current))
         except Exception as e:
             ErrorLogger.log_error("Error checking unplugged status", e)
         finally:
             # Always emit check_complete, even if nothing changed
             self.check_complete.emit()
 
+    @property
+    def unplugged_channels(self) -> List[int]:
+        """1-based channels that read 0.00 mV at the last check."""
+        return _mask_channels(self._unplugged_mask)
+
+    def _read_unplugged(self) -> int:
+        """Return a bitmask of the channels reading 0.00 mV (bit 0 = channel 1)."""
+        read_all = getattr(self.device, "get_all_mv", None)
+        if read_all is not None:
+            # One block read of all mV registers instead of one transaction per channel
+            try:
+                mvs = read_all()
+                mask = 0
+                for i, mv in enumerate(mvs[:self.channels]):
+                    if mv == 0.0:
+                        mask |= 1 << i
+                return mask
+            except Exception as e:
+                ErrorLogger.log_error("Error reading voltage of all channels", e)
+        mask = 0
+        for ch in range(1, self.channels + 1):
+            try:
+                if self.device.get_mv(ch) == 0.0:
+                    mask |= 1 << (ch - 1)
+            except Exception as e:
+                ErrorLogger.log_error(f"Error checking voltage on CH{ch}", e)
+        return mask
+
     def run(self) -> None:  # pragma: no cover - involves timing and threads
         if self._startup_error:
             error_msg = f"Falling back to dummy: {self._startup_error}"
@@ -184,32 +228,97 @@ class ThermoThread(QThread):
         
         # Only show noise source info if we're using dummy data
         if self.source == "dummy":
-            noise_source = "Perlin noise" if HAS_PERLIN else "sine wave (fallback)"
-            msg = f"Using {noise_source} for dummy data"
+            msg = "Using Perlin noise for dummy data"
             self.error.emit(msg)
             ErrorLogger.log_info(msg)
 
-        while not self._stop:
-            readings: List[float] = []
-            for idx in range(self.channels):
+        # Bound once: the device and signal do not change while the thread runs
+        self._read_all = getattr(self.device, "get_all_temps", None)
+        self._get_temp = self.device.get_temp
+        self._emit_reading = self.reading_ready.emit
+        self._blank = [math.nan] * self.channels
+
+        # Sample from a timer in this thread's event loop instead of sleeping between reads:
+        # the period does not drift by the read time and stop() ends the loop at once.
+        # DirectConnection runs _sample here, not in the GUI thread that owns this object.
+        timer = QTimer()
+        timer.setTimerType(Qt.PreciseTimer)
+        timer.timeout.connect(self._sample, Qt.DirectConnection)
+        timer.start(int(self.interval_sec * 1000))
+        self._sample()
+        self.exec_()
+        timer.stop()
+
+    def _sample(self) -> None:
+        """Take one reading of the enabled channels and emit it."""
+        if self._stop:
+            self.quit()
+            return
+        # Disabled channels are not read (each read is a bus transaction) and report NaN.
+        # A copy per tick, not one shared buffer: the GUI thread keeps a reference to the
+        # emitted list (last_readings) and reads it while the next tick is being taken.
+        readings: List[float] = self._blank[:]
+        if self._read_all is not None:
+            # One evaluation for every channel instead of one call per channel
+            try:
+                values = self._read_all()
+                for idx in self._enabled_channels():
+                    readings[idx] = values[idx]
+            except Exception as exc:
+                self._report_reading_error(None, exc)
+        else:
+            get_temp = self._get_temp
+            for idx in self._enabled_channels():
                 try:
-                    temp = self.device.get_temp(idx + 1)
-                    readings.append(temp)
+                    readings[idx] = get_temp(idx + 1)
                 except Exception as exc:
-                    error_msg = str(exc)
-                    self.error.emit(error_msg)
-                    ErrorLogger.log_reading_error(idx + 1, error_msg)
-                    readings.append(float("nan"))
-            self.reading_ready.emit(readings)
-            
-            # Periodically check for unplugged channel changes
-            self._check_counter += 1
-            if self._check_counter >= self._check_interval:
-                self._check_counter = 0
-                self._check_unplugged_status()
-            
-            self.msleep(int(self.interval_sec * 1000))
+                    self._report_reading_error(idx + 1, exc)
+        self._emit_reading(readings)
+        
+        # Periodically check for unplugged channel changes
+        self._check_counter += 1
+        if self._check_counter >= self._check_interval:
+            self._check_counter = 0
+            self._check_unplugged_status()
+
+    def _report_reading_error(self, channel, exc: Exception) -> None:
+        """Emit and log a reading error, at most once per ERROR_THROTTLE_SEC for the same channel and error.
+
+        channel is None when reading all channels at once failed.
+        """
+        key = (channel, exc.__class__)
+        now = time.monotonic()
+        last = self._error_times.get(key)
+        if last is not None and now - last < ERROR_THROTTLE_SEC:
+            self._error_suppressed[key] = self._error_suppressed.get(key, 0) + 1
+            return
+        self._error_times[key] = now
+        error_msg = str(exc)
+        suppressed = self._error_suppressed.pop(key, 0)
+        if suppressed:
+            error_msg += f" ({suppressed} similar errors suppressed)"
+        self.error.emit(error_msg)
+        if channel is None:
+            ErrorLogger.log_warning(f"[READING] Reading all channels failed: {error_msg}")
+        else:
+            ErrorLogger.log_reading_error(channel, error_msg)
+
+    def _enabled_channels(self):
+        """Return the 0-based channel indices to read this tick: enabled and not unplugged.
+
+        Unplugged channels report NaN until a periodic check finds them connected again.
+        """
+        enabled = self.settings_manager.get_enabled_channels_array() if self.settings_manager else None
+        key = (enabled, self._unplugged_mask)
+        if key != self._active_key:
+            if enabled is None:
+                enabled = range(self.channels)
+            mask = self._unplugged_mask
+            self._active = [idx for idx in enabled if idx < self.channels and not mask >> idx & 1]
+            self._active_key = key
+        return self._active
 
     def stop(self, timeout_ms: int = 1000) -> None:
         self._stop = True
+        self.quit()  # Also honoured if the event loop has not started yet
         self.wait(timeout_ms)
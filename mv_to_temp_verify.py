@@ -14,6 +14,9 @@ Default channel: 1
 import sys
 from datetime import datetime
 
+import numpy as np
+from numpy.polynomial import polynomial as P
+
 try:
     import sm_tc
 except ImportError as e:
@@ -22,7 +25,7 @@ except ImportError as e:
     sys.exit(1)
 
 # ITS-90 inverse polynomial coefficients for K-type (µV -> °C)
-_K_INV_COEFF_NEG = [
+_K_INV_COEFF_NEG = np.asarray([
     0.0,
     2.5173462e-02,
     -1.1662878e-06,
@@ -32,9 +35,9 @@ _K_INV_COEFF_NEG = [
     -8.6632643e-20,
     -1.0450598e-23,
     -5.1920577e-29,
-]
+], dtype=np.float64)
 
-_K_INV_COEFF_MID = [
+_K_INV_COEFF_MID = np.asarray([
     0.0,
     2.508355e-02,
     7.860106e-08,
@@ -45,9 +48,9 @@ _K_INV_COEFF_MID = [
     -4.413030e-26,
     1.057734e-30,
     -1.052755e-35,
-]
+], dtype=np.float64)
 
-_K_INV_COEFF_HIGH = [
+_K_INV_COEFF_HIGH = np.asarray([
     -1.318058e+02,
     4.830222e-02,
     -1.646031e-06,
@@ -55,28 +58,33 @@ _K_INV_COEFF_HIGH = [
     -9.650715e-16,
     8.802193e-21,
     -3.110810e-26,
-]
+], dtype=np.float64)
+
 
+# Valid K-type range and the boundary between the mid and high polynomials (µV)
+_K_UV_MIN = -5891
+_K_UV_MAX = 54886
+_K_UV_MID_MAX = 20644
 
-def _poly_eval(coeffs, x):
-    """Evaluate polynomial via Horner's method."""
-    acc = 0.0
-    for c in reversed(coeffs):
-        acc = acc * x + c
-    return acc
+
+def k_type_uv_to_c_vec(uV):
+    """Convert an array of K-type voltages (µV) to temperatures (°C) using ITS-90."""
+    uV = np.asarray(uV, dtype=np.float64)
+    if np.any((uV < _K_UV_MIN) | (uV > _K_UV_MAX)):
+        raise ValueError('Voltage out of K-type range [-5891..54886] µV')
+    out = np.empty_like(uV)
+    neg = uV < 0
+    hi = uV > _K_UV_MID_MAX
+    mid = ~(neg | hi)
+    out[neg] = P.polyval(uV[neg], _K_INV_COEFF_NEG)
+    out[mid] = P.polyval(uV[mid], _K_INV_COEFF_MID)
+    out[hi] = P.polyval(uV[hi], _K_INV_COEFF_HIGH)
+    return out
 
 
 def k_type_uv_to_c(uV):
     """Convert K-type thermocouple voltage (µV) to temperature (°C) using ITS-90."""
-    if uV < -5891 or uV > 54886:
-        raise ValueError('Voltage out of K-type range [-5891..54886] µV')
-    if uV < 0:
-        coeffs = _K_INV_COEFF_NEG
-    elif uV <= 20644:
-        coeffs = _K_INV_COEFF_MID
-    else:
-        coeffs = _K_INV_COEFF_HIGH
-    return _poly_eval(coeffs, uV)
+    return float(k_type_uv_to_c_vec(uV))
 
 
 def k_type_mv_to_c(mV):
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import sys
 import logging
+import math
 from typing import List, Optional
 from datetime import datetime
 
@@ -114,7 +115,7 @@ class EpaperDisplay:
                 draw.text((x_pos, y_pos_current), label, font=self.font_medium, fill=0)
 
                 # Temperature value
-                if isinstance(reading, float) and not float('nan'):
+                if isinstance(reading, (int, float)) and not math.isnan(reading):
                     value_text = f"{reading:.1f}°C"
                 else:
                     value_text = "-- °C"
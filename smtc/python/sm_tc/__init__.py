@@ -100,6 +100,18 @@ class SMtc:
         bus.close()
         return val[0] / _MV_SCALE_FACTOR
 
+    def get_all_mv(self):
+        """Read the voltage of all channels in mV with one block read (index 0 = channel 1)."""
+        bus = smbus2.SMBus(self._i2c_bus_no)
+        try:
+            buff = bus.read_i2c_block_data(self._hw_address_, _TCP_MV1_ADD, _IN_CH_COUNT * _TEMP_SIZE_BYTES)
+            val = struct.unpack('%dh' % _IN_CH_COUNT, bytearray(buff))
+        except Exception as e:
+            bus.close()
+            raise Exception("Fail to read with exception " + str(e))
+        bus.close()
+        return [v / _MV_SCALE_FACTOR for v in val]
+
     def get_diag_temperature(self):
             """Read on-board CPU/diagnostic temperature in °C (1 byte, signed)."""
             bus = smbus2.SMBus(self._i2c_bus_no)
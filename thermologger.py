@@ -1,4 +1,5 @@
 import sys
+import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from collections import deque
@@ -15,9 +16,6 @@ try:
 except Exception:
     GPIO = None
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
 
 from backend.thermo_worker import ThermoThread
 from backend.epaper_display import EpaperDisplay
@@ -26,10 +24,24 @@ from backend.settings_manager import SettingsManager
 from backend.error_logger import ErrorLogger
 from ui.settings_dialog import SettingsDialog
 
+UI_DIR = Path(__file__).parent / "ui"
+FONTS_DIR = Path(__file__).parent / "fonts"
+SENSOR_UI_FILE = UI_DIR / "sensor.ui"
+
+_sensor_form_class = None  # Form class compiled from sensor.ui on first use
+
+
+def sensor_form_class():
+    """Return the form class for sensor.ui, parsing the file only once for all sensors."""
+    global _sensor_form_class
+    if _sensor_form_class is None:
+        _sensor_form_class, _ = uic.loadUiType(str(SENSOR_UI_FILE))
+    return _sensor_form_class
+
 
 def load_fonts():
     """Load custom fonts from the fonts directory and system."""
-    fonts_dir = Path(__file__).parent / "fonts"
+    fonts_dir = FONTS_DIR
     
     # Try to load fonts from local fonts directory
     if fonts_dir.exists():
@@ -204,17 +216,24 @@ class SensorWidget(QWidget):
         super().__init__(parent)
         self.sensor_name = sensor_name
         self.is_unplugged = False
+        self._last_text = None  # Text last set on label_value, to skip repaints when unchanged
+        self._last_value = float("nan")  # Reading that text was formatted from (NaN never matches)
         self.load_ui()
+        # Resolved once; None when sensor.ui has no such widget
+        self._label_value = getattr(self, 'label_value', None)
+        self._label_name = getattr(self, 'label_name', None)
     
     def load_ui(self):
         """Load the sensor UI file."""
-        ui_dir = Path(__file__).parent / "ui"
-        sensor_ui_file = ui_dir / "sensor.ui"
+        sensor_ui_file = SENSOR_UI_FILE
         
         # Load the sensor.ui file
-        if sensor_ui_file.exists():
+        if _sensor_form_class is not None or sensor_ui_file.exists():
             try:
-                uic.loadUi(str(sensor_ui_file), self)
+                form = sensor_form_class()()
+                form.setupUi(self)
+                # Expose the child widgets on self, as uic.loadUi does
+                self.__dict__.update(vars(form))
                 # Update the sensor name if there's a label named 'label_name'
                 if hasattr(self, 'label_name'):
                     self.label_name.setText(self.sensor_name)
@@ -229,26 +248,38 @@ class SensorWidget(QWidget):
     def update_value(self, value):
         """Update the sensor value display."""
         # Update the label_value with the temperature value
-        if hasattr(self, 'label_value'):
+        if self._label_value is not None:
             if self.is_unplugged:
-                self.label_value.setText("-- °C")
+                self._set_value_text("-- °C")
                 return
+            if value == self._last_value:
+                return  # Same reading as shown: skip float() and formatting
+            self._last_value = value
             try:
                 numeric_value = float(value)
                 text = f"{numeric_value:.1f}°C"
             except (TypeError, ValueError):
                 text = "-- °C"
-            self.label_value.setText(text)
+            self._set_value_text(text)
+
+    def _set_value_text(self, text):
+        """Set label_value only when the text differs from what is shown."""
+        if text != self._last_text:
+            self._last_text = text
+            self._label_value.setText(text)
 
     def set_unplugged(self, unplugged: bool):
         """Visually dim the widget when the channel is unplugged."""
+        if unplugged == self.is_unplugged:
+            return  # Style sheets trigger a full restyle; only touch them on a change
         self.is_unplugged = unplugged
-        if hasattr(self, 'label_name'):
-            self.label_name.setStyleSheet("color: #888;" if unplugged else "")
-        if hasattr(self, 'label_value'):
-            self.label_value.setStyleSheet("color: #888;" if unplugged else "")
+        self._last_value = float("nan")  # Shown text no longer matches the last reading
+        if self._label_name is not None:
+            self._label_name.setStyleSheet("color: #888;" if unplugged else "")
+        if self._label_value is not None:
+            self._label_value.setStyleSheet("color: #888;" if unplugged else "")
             if unplugged:
-                self.label_value.setText("-- °C")
+                self._set_value_text("-- °C")
 
 
 class PlotWindow(QWidget):
@@ -262,6 +293,10 @@ class PlotWindow(QWidget):
         layout = QVBoxLayout()
         self.setLayout(layout)
         
+        # Import matplotlib only once the plot window is actually opened
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
         # Create matplotlib figure and canvas
         self.fig = Figure(figsize=(8, 6))
         self.ax = self.fig.add_subplot(111)
@@ -311,6 +346,7 @@ class PlotWindow(QWidget):
             self.ax.legend(loc="upper left")
         
         # Format time axis
+        import matplotlib.dates as mdates
         self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
         self.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
         
@@ -366,13 +402,16 @@ class MainWindow(QMainWindow):
         # Increased maxlen to handle faster sampling rates safely
         self.history = deque(maxlen=7200)  # 2 hours max at 1 Hz (safety buffer)
         self.history_max_age_hours = 2.0  # Keep max 2 hours of data
+        # Logging and the regular e-paper refresh are driven by the reader's readings
+        # (see update_readings) rather than by timers of their own, so the CPU wakes
+        # once per reading. The e-paper timer only runs for fast flash animations.
+        self.reader_interval = 1.0  # Seconds between readings from the worker
         self.epaper_update_timer = QTimer()
         self.epaper_update_timer.timeout.connect(self.update_epaper_display)
-        self.epaper_base_interval = 5000  # ms
-        self.epaper_update_timer.start(self.epaper_base_interval)  # Update e-paper every 5 seconds
-        self.logging_timer = QTimer()
-        self.logging_timer.timeout.connect(self.on_logging_timer)
+        self.epaper_base_interval = 5000  # ms, update e-paper every 5 seconds
+        self._epaper_ticks = 0  # Readings since the last regular e-paper update
         self.logging_interval = 5  # Default 5 seconds
+        self._log_ticks = 0  # Readings since the last logged row
         self.gpio_buttons = None
         
         # Periodic cleanup timer to prevent memory buildup
@@ -401,8 +440,7 @@ class MainWindow(QMainWindow):
     def init_ui(self):
         """Initialize the user interface from the UI file."""
         # Get the path to the UI file
-        ui_dir = Path(__file__).parent / "ui"
-        ui_file = ui_dir / "main.ui"
+        ui_file = UI_DIR / "main.ui"
         
         # Check if UI file exists
         if not ui_file.exists():
@@ -518,7 +556,6 @@ class MainWindow(QMainWindow):
         """Map button presses (UI or GPIO) to actions."""
         print(f"[BUTTON] Handle button {button_index} (checking current state...)")
         print(f"[BUTTON]   - is_logging: {self.logger.is_logging}")
-        print(f"[BUTTON]   - logging_timer active: {self.logging_timer.isActive()}")
         
         if button_index == 1:
             # Toggle start/pause logging
@@ -550,7 +587,7 @@ class MainWindow(QMainWindow):
 
     def start_worker(self):
         """Start the background reader thread."""
-        self.worker = ThermoThread(interval_sec=1.0, channels=self.channel_count, settings_manager=self.settings_manager)
+        self.worker = ThermoThread(interval_sec=self.reader_interval, channels=self.channel_count, settings_manager=self.settings_manager)
         self.worker.reading_ready.connect(self.update_readings)
         self.worker.source_changed.connect(self.on_source_changed)
         self.worker.error.connect(self.on_error)
@@ -613,6 +650,7 @@ class MainWindow(QMainWindow):
         # Use tuple of timestamp and tuple (not list) to save memory
         current_time = datetime.now()
         self.history.append((current_time, tuple(readings)))
+        self.epaper.push_history(current_time, readings)
         
         for idx, value in enumerate(readings):
             if idx < len(self.sensors):
@@ -624,6 +662,21 @@ class MainWindow(QMainWindow):
         if self.plot_window and self.plot_window.isVisible():
             self.plot_window.update_plot(self.history, self.channel_count, self.settings_manager)
 
+        if self.logger.is_logging:
+            self._log_ticks += 1
+            if self._log_ticks >= self._readings_per(self.logging_interval):
+                self._log_ticks = 0
+                self.log_current_reading()
+        if not self.epaper_update_timer.isActive():
+            self._epaper_ticks += 1
+            if self._epaper_ticks >= self._readings_per(self.epaper_base_interval / 1000):
+                self._epaper_ticks = 0
+                self.update_epaper_display()
+
+    def _readings_per(self, seconds: float) -> int:
+        """Number of worker readings that make up the given period (at least 1)."""
+        return max(1, round(seconds / self.reader_interval))
+
     def on_source_changed(self, source: str):
         message = f"Reading source: {source}"
         print(message)
@@ -638,13 +691,12 @@ class MainWindow(QMainWindow):
     def update_epaper_display(self):
         """Update e-paper display with current readings."""
         if self.last_readings:
-            self.epaper.set_history(self.history)
             image = self.epaper.display_readings(self.last_readings)
             if image and self.preview_window:
                 self.preview_window.update_preview(image)
 
             # If flashing finished, restore normal epaper cadence
-            if self.epaper.flash_ticks == 0 and self.epaper_update_timer.interval() != self.epaper_base_interval:
+            if self.epaper.flash_ticks == 0 and self.epaper_update_timer.isActive():
                 self.restore_epaper_update_interval()
 
     def show_plot_window(self):
@@ -701,11 +753,12 @@ class MainWindow(QMainWindow):
         """Open the settings dialog."""
         dialog = SettingsDialog(self.settings_manager, self)
         dialog.exec_()
+        self.epaper.invalidate_channel_config()
 
     def start_logging(self):
         """Start logging temperature data."""
         self.logger.start_logging()
-        self.logging_timer.start(self.logging_interval * 1000)
+        self._log_ticks = 0  # First row one logging interval from now
         self.epaper.set_logging_status(True, message=None)
         if hasattr(self, 'actionStart'):
             self.actionStart.setEnabled(False)
@@ -718,7 +771,6 @@ class MainWindow(QMainWindow):
 
     def pause_logging(self):
         """Pause logging without closing the file."""
-        self.logging_timer.stop()
         self.logger.stop_logging()
         self.epaper.set_logging_status(False, message="Logging paused")
         if hasattr(self, 'statusbar'):
@@ -729,7 +781,6 @@ class MainWindow(QMainWindow):
 
     def stop_logging(self):
         """Stop logging temperature data."""
-        self.logging_timer.stop()
         self.logger.stop_logging()
         self.epaper.set_logging_status(False, message="Logging stopped")
         if hasattr(self, 'actionStart'):
@@ -741,7 +792,6 @@ class MainWindow(QMainWindow):
 
     def reset_logging(self):
         """Reset logging (stop and prepare for new log file)."""
-        self.logging_timer.stop()
         self.logger.stop_logging()
         self.epaper.set_logging_status(False, message="Logging reset")
         if hasattr(self, 'actionStart'):
@@ -791,9 +841,9 @@ class MainWindow(QMainWindow):
         self.epaper_update_timer.start(interval_ms)
 
     def restore_epaper_update_interval(self):
-        """Restore the default e-paper update interval."""
+        """Restore the default e-paper update interval (driven by readings again)."""
         self.epaper_update_timer.stop()
-        self.epaper_update_timer.start(self.epaper_base_interval)
+        self._epaper_ticks = 0
 
     def recheck_thermocouples(self):
         """Manually trigger a thermocouple connection check."""
@@ -822,22 +872,19 @@ class MainWindow(QMainWindow):
             self.action20.setChecked(seconds == 20)
         if hasattr(self, 'action1_min'):
             self.action1_min.setChecked(seconds == 60)
-        # Restart timer if logging is active
-        if self.logging_timer.isActive():
-            self.logging_timer.stop()
-            self.logging_timer.start(self.logging_interval * 1000)
+        # Restart the interval if logging is active
+        self._log_ticks = 0
         if hasattr(self, 'statusbar'):
             self.statusbar.showMessage(f"Logging interval set to {seconds}s", 3000)
 
-    def on_logging_timer(self):
-        """Called when logging timer fires to log current readings."""
+    def log_current_reading(self):
+        """Log the current readings; called every logging_interval worth of readings."""
         if self.last_readings:
             from datetime import datetime
             self.logger.log_reading(self.last_readings)
             self.epaper.set_logging_status(True, datetime.now(), message=None)
 
     def closeEvent(self, event):
-        self.logging_timer.stop()
         self.logger.stop_logging()
         self.epaper_update_timer.stop()
         if self.worker and self.worker.isRunning():
@@ -853,6 +900,12 @@ class MainWindow(QMainWindow):
 def main():
     """Main entry point for the application."""
     try:
+        # No log format in this app shows thread or process details, so skip collecting
+        # them. These are logging module globals and apply to every logger in the process.
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         # Initialize error logging first
         error_logger = ErrorLogger()
         ErrorLogger.log_info("=" * 80)